@@ -1,6 +1,10 @@
 from abc import ABCMeta, abstractmethod
+import atexit
+import copy
+import queue
 import threading
 import logging
+import logging.handlers
 
 
 class SingletonMeta(type):
@@ -8,10 +12,14 @@ class SingletonMeta(type):
     _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        with cls._lock:
-            if cls not in cls._instances:
-                cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # lock-free once created, every module calls MyLogger() at import
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = cls._instances[cls] = super().__call__(*args, **kwargs)
+        return instance
 
 
 class SingletonABCMeta(ABCMeta, SingletonMeta):
@@ -21,31 +29,124 @@ class SingletonABCMeta(ABCMeta, SingletonMeta):
 
 class BaseLogger(metaclass=SingletonABCMeta):
     @abstractmethod
-    def debug(cls, message: str):
+    def debug(cls, message: str, *args):
         pass
 
     @abstractmethod
-    def info(cls, message: str):
+    def info(cls, message: str, *args):
         pass
 
     @abstractmethod
-    def warning(cls, message: str):
+    def warning(cls, message: str, *args):
         pass
 
     @abstractmethod
-    def error(cls, message: str):
+    def error(cls, message: str, *args):
         pass
 
     @abstractmethod
-    def critical(cls, message: str):
+    def critical(cls, message: str, *args):
         pass
 
 
+_exc_formatter = logging.Formatter()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most `burst` records with the same message template through per `interval` seconds.
+    The first record after a window with drops notes how many were suppressed.
+    """
+
+    def __init__(self, interval: float = 1.0, burst: int = 5):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self._windows = {}      # (logger, level, template) -> [window start, count, suppressed]
+        # filters run on whichever thread logs (main loop, asset loaders)
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = (record.name, record.levelno, record.msg)
+        now = record.created
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} [{suppressed} similar suppressed]"
+                return True
+            if window[1] < self.burst:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues the record with its message merged but not formatted: the args are applied here,
+    while they still hold the values at the call, and the Formatter runs on the listener thread.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # the traceback cannot cross threads, keep its text
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class LogChannel:
+    """
+    Logger for one subsystem (a child of my_logger). The `*_enabled` flags are plain
+    attributes, so hot paths can skip a call entirely with `if logger.debug_enabled:`.
+    Arguments are %-formatted lazily, only for records that are actually written.
+    """
+    __slots__ = ("_logger", "debug_enabled", "info_enabled")
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+        self.refresh()
+
+    def refresh(self):
+        self.debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        self.info_enabled = self._logger.isEnabledFor(logging.INFO)
+
+    def debug(self, message: str, *args):
+        if self.debug_enabled:
+            self._logger.debug(message, *args, stacklevel=2)
+
+    def info(self, message: str, *args):
+        if self.info_enabled:
+            self._logger.info(message, *args, stacklevel=2)
+
+    def warning(self, message: str, *args):
+        self._logger.warning(message, *args, stacklevel=2)
+
+    def error(self, message: str, *args):
+        self._logger.error(message, *args, stacklevel=2)
+
+    def critical(self, message: str, *args):
+        self._logger.critical(message, *args, stacklevel=2)
+
+
 # MyLogger is a concrete implementation of BaseLogger.
 class MyLogger(BaseLogger):
-    def __init__(self):
+    """
+    Game-wide logging. Callers only enqueue records; a QueueListener thread formats them
+    and does the file and console IO, so a slow disk never stalls a frame.
+    """
+
+    def __init__(self, level=logging.INFO):
         self._logger = logging.getLogger('my_logger')
-        self._logger.setLevel(logging.DEBUG)
+        self._logger.setLevel(level)
+        self._logger.propagate = False
         file_handler = logging.FileHandler('my_log_file.log')
         file_handler.setLevel(logging.DEBUG)
         console_handler = logging.StreamHandler()
@@ -55,23 +156,70 @@ class MyLogger(BaseLogger):
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
-
-    def debug(self, message: str):
-        self._logger.debug(message)
-
-    def info(self, message: str):
-        self._logger.info(message)
-
-    def warning(self, message: str):
-        self._logger.warning(message)
-
-    def error(self, message: str):
-        self._logger.error(message)
-
-    def critical(self, message: str):
-        self._logger.critical(message)
+        # filters run on the calling thread, so rate-limited records are dropped before queueing
+        queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+        self.rate_limit = RateLimitFilter()
+        queue_handler.addFilter(self.rate_limit)
+        self._logger.addHandler(queue_handler)
+
+        self._listener = logging.handlers.QueueListener(queue_handler.queue,
+                                                        file_handler,
+                                                        console_handler,
+                                                        respect_handler_level=True)
+        self._listener.start()
+        self._listening = True
+        atexit.register(self.flush)
+
+        self._root = LogChannel(self._logger)
+        self._channels = {}
+
+    def channel(self, subsystem: str) -> LogChannel:
+        """Logger for `subsystem`, its level can be set on its own with set_level."""
+        channel = self._channels.get(subsystem)
+        if channel is None:
+            channel = self._channels[subsystem] = LogChannel(self._logger.getChild(subsystem))
+        return channel
+
+    def set_level(self, level, subsystem: str = None):
+        """Level for everything, or only for `subsystem` (None there inherits the global level)."""
+        target = self._logger if subsystem is None else self._logger.getChild(subsystem)
+        target.setLevel(level if level is not None else logging.NOTSET)
+        self._root.refresh()
+        for channel in self._channels.values():
+            channel.refresh()
+
+    def configure(self, level, subsystem_levels: dict = None):
+        """Global level plus {subsystem: level} overrides, e.g. from the game constants."""
+        self.set_level(level)
+        for subsystem, subsystem_level in (subsystem_levels or {}).items():
+            self.set_level(subsystem_level, subsystem)
+
+    def flush(self):
+        """Write out everything queued so far (stops the listener, used at exit)."""
+        if self._listening:
+            self._listening = False
+            self._listener.stop()
+
+    @property
+    def debug_enabled(self) -> bool:
+        return self._root.debug_enabled
+
+    def debug(self, message: str, *args):
+        if self._root.debug_enabled:
+            self._logger.debug(message, *args, stacklevel=2)
+
+    def info(self, message: str, *args):
+        if self._root.info_enabled:
+            self._logger.info(message, *args, stacklevel=2)
+
+    def warning(self, message: str, *args):
+        self._logger.warning(message, *args, stacklevel=2)
+
+    def error(self, message: str, *args):
+        self._logger.error(message, *args, stacklevel=2)
+
+    def critical(self, message: str, *args):
+        self._logger.critical(message, *args, stacklevel=2)
 
 
 logger = MyLogger()
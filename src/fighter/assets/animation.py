@@ -0,0 +1,53 @@
+import pygame
+from src.fighter.assets.sprite_loader import Frame
+
+
+class Animation:
+    """
+    Frames of one sprite sheet, one list per action row, as drawn on the sheet (facing right).
+    Mirrored (facing left) rows are built on first use and shared by every user of the sheet.
+    Frame offsets are relative to the top-left of the `cell_size` square the sheet was cut into.
+    With a `store`, mirrored surfaces are deduplicated against every other variant.
+    """
+    __slots__ = ("_right", "_left", "cell_size", "_store")
+
+    def __init__(self, frames: list[list[Frame]], cell_size: int, store=None):
+        self._right = frames
+        self._left: list = [None] * len(frames)
+        self.cell_size = cell_size
+        self._store = store
+
+    def _mirror(self, frame: Frame) -> Frame:
+        x, y = frame.offset
+        flipped = pygame.transform.flip(frame.surface, True, False)
+        if self._store is not None:
+            flipped = self._store.intern_mirror(frame.surface, flipped)
+        return Frame(flipped, (self.cell_size - x - frame.surface.get_width(), y))
+
+    def frames(self, action: int, facing_right: bool = True) -> list[Frame]:
+        if facing_right:
+            return self._right[action]
+        row = self._left[action]
+        if row is None:
+            row = [self._mirror(frame) for frame in self._right[action]]
+            self._left[action] = row
+        return row
+
+    @property
+    def nbytes(self) -> int:
+        """Pixel memory of every frame built so far, mirrored rows included."""
+        return sum(s.get_pitch() * s.get_height() for s in self.surfaces())
+
+    def surfaces(self) -> set:
+        """Distinct surfaces of every frame built so far, mirrored rows included."""
+        rows = self._right + [row for row in self._left if row is not None]
+        return {f.surface for row in rows for f in row}
+
+    def frame(self, action: int, index: int, facing_right: bool = True) -> Frame:
+        return self.frames(action, facing_right)[index]
+
+    def __getitem__(self, action: int) -> list[Frame]:
+        return self._right[action]
+
+    def __len__(self):
+        return len(self._right)
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Callable, Hashable
+
+# shared recency clock, lets the AssetManager compare entries across caches
+_use_clock = count()
+
+
+class AssetCache:
+    """
+    One kind of asset kept in least-recently-used order, with byte accounting.
+    Entry sizes come from `sizeof(key, value)` at query time, so assets that grow after
+    insertion (lazily mirrored animations) are still counted correctly.
+    Keys in the shared `pinned` set are never evicted.
+    """
+
+    def __init__(self, name: str, sizeof: Callable[[Hashable, Any], int], pinned: set):
+        self.name = name
+        self.sizeof = sizeof
+        self.pinned = pinned
+        self._entries: OrderedDict = OrderedDict()     # key -> [value, last_used]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> [hits, misses, evictions], survives eviction
+        self._key_stats: dict = {}
+
+    def _counters(self, key):
+        counters = self._key_stats.get(key)
+        if counters is None:
+            counters = self._key_stats[key] = [0, 0, 0]
+        return counters
+
+    def get(self, key: Hashable):
+        """Value for key (marked as just used), or None and a recorded miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            self._counters(key)[1] += 1
+            return None
+        self.hits += 1
+        self._counters(key)[0] += 1
+        entry[1] = next(_use_clock)
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value):
+        self._entries[key] = [value, next(_use_clock)]
+        self._entries.move_to_end(key)
+
+    def peek(self, key: Hashable):
+        """Value for key without touching recency or stats."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def keys(self):
+        return list(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def oldest_evictable(self):
+        """(last_used, key) of the least recently used unpinned entry, or None."""
+        for key, (_, last_used) in self._entries.items():
+            if key not in self.pinned:
+                return last_used, key
+        return None
+
+    def evict(self, key: Hashable) -> int:
+        """Drop one entry, returns the bytes it held."""
+        value, _ = self._entries.pop(key)
+        self.evictions += 1
+        self._counters(key)[2] += 1
+        return self.sizeof(key, value)
+
+    def evict_unpinned(self) -> int:
+        freed = 0
+        for key in [k for k in self._entries if k not in self.pinned]:
+            freed += self.evict(key)
+        return freed
+
+    def clear(self):
+        self._entries.clear()
+
+    @property
+    def bytes(self) -> int:
+        return sum(self.sizeof(key, value) for key, (value, _) in self._entries.items())
+
+    def stats(self) -> dict:
+        entries = {}
+        for key, (hits, misses, evictions) in self._key_stats.items():
+            entry = self._entries.get(key)
+            entries[key] = {
+                "hits": hits,
+                "misses": misses,
+                "evictions": evictions,
+                "bytes": self.sizeof(key, entry[0]) if entry else 0,
+                "cached": entry is not None,
+                "pinned": key in self.pinned,
+            }
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes": self.bytes,
+            "entries": entries,
+        }
@@ -2,27 +2,94 @@
 import pygame
 from ..metaclass import SingletonMeta
 from src.fighter.assets.assets_path_enum import *
-from typing import Union
+import os
+from typing import NamedTuple, Union
 from src.fighter.assets.sprite_loader import load_frames
+from src.fighter.assets.animation import Animation
+from src.fighter.assets.frame_cache import cache_key, load_cached_frames, store_frames
+from src.fighter.assets.asset_cache import AssetCache
+from src.fighter.assets.frame_store import FrameStore, frame_digests
+from src.fighter.assets.mask_cache import MaskCache
+from src.fighter.assets.sound_cache import load_sound
+from src.fighter.core.constants import FRAME_CACHE, ASSET_MEMORY_BUDGET
+from src.fighter.core.enums import AssetKind
 from logger import MyLogger
 
-logger = MyLogger()
+logger = MyLogger().channel("assets")
 
 ImageKey = Union[InGameImageKey, EntityImageKey]
 
 
+class AnimationKey(NamedTuple):
+    """Everything an animation's frames depend on: one sheet can be cached at several scales/layouts."""
+    sheet: EntityImageKey
+    size: int
+    scale: int
+    frames_per: tuple
+
+
+def surface_bytes(key, surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+def sound_bytes(key, sound: pygame.mixer.Sound) -> int:
+    init = pygame.mixer.get_init()
+    if init is None:
+        return 0
+    frequency, fmt, channels = init
+    return int(sound.get_length() * frequency) * channels * (abs(fmt) // 8)
+
+
+def font_bytes(key, font: pygame.font.Font) -> int:
+    # glyphs are rendered on demand, the font file is what stays resident
+    return os.path.getsize(key.path)
+
+
+def animation_bytes(key, animation: Animation) -> int:
+    return animation.nbytes
+
+
 class AssetManager(metaclass=SingletonMeta):
-    def __init__(self):
-        self._images = {}
-        self._sounds = {}
-        self._fonts = {}
-        self._animations = {}
+    """
+    Loads and caches assets. Each kind lives in an LRU AssetCache; when the total
+    goes over `budget` bytes, the least recently used unpinned entries are evicted.
+    """
+
+    def __init__(self, budget: int = ASSET_MEMORY_BUDGET):
+        self.budget = budget
+        self._pinned = set()
+        self._images = AssetCache("images", surface_bytes, self._pinned)
+        self._sounds = AssetCache("sounds", sound_bytes, self._pinned)
+        self._fonts = AssetCache("fonts", font_bytes, self._pinned)
+        self._animations = AssetCache("animations", animation_bytes, self._pinned)
+        # frame surfaces shared by all animation variants
+        self._frames = FrameStore()
+        # collision masks of those surfaces, per frame and orientation
+        self._masks = MaskCache()
+        self._caches = {
+            AssetKind.IMAGE: self._images,
+            AssetKind.SOUND: self._sounds,
+            AssetKind.FONT: self._fonts,
+            AssetKind.ANIMATION: self._animations,
+        }
 
     def get_image(self, key: ImageKey) -> pygame.Surface:
+        img = self._images.get(key)
+        if img is None:
+            img = pygame.image.load(str(key.path))
+            # convert to the display format when there is one (not in headless runs)
+            if pygame.display.get_surface() is not None:
+                img = img.convert_alpha()
+            self._store(self._images, key, img)
+        return img
+
+    def put_image(self, key: ImageKey, surface: pygame.Surface):
+        """Store an image loaded elsewhere (the preloader), unless one is cached already."""
         if key not in self._images:
-            img = pygame.image.load(str(key.path)).convert_alpha()
-            self._images[key] = img
-        return self._images[key]
+            self._store(self._images, key, surface)
+
+    def has_image(self, key: ImageKey) -> bool:
+        return key in self._images
 
     @staticmethod
     def get_width_height(key: ImageKey) -> tuple[int,int]:
@@ -31,24 +98,163 @@ class AssetManager(metaclass=SingletonMeta):
         return raw.get_size()
 
     def get_sound(self, key: SoundKey) -> pygame.mixer.Sound:
+        sound = self._sounds.get(key)
+        if sound is None:
+            sound = load_sound(key.path)
+            self._store(self._sounds, key, sound)
+        return sound
+
+    def put_sound(self, key: SoundKey, sound: pygame.mixer.Sound):
         if key not in self._sounds:
-            self._sounds[key] = pygame.mixer.Sound(str(key.path))
-        return self._sounds[key]
+            self._store(self._sounds, key, sound)
+
+    def has_sound(self, key: SoundKey) -> bool:
+        return key in self._sounds
 
     def get_font(self, key: FontKey) -> pygame.font.Font:
-        if key not in self._fonts:
+        font = self._fonts.get(key)
+        if font is None:
             # FontKey.path and FontKey.size
-            self._fonts[key] = pygame.font.Font(str(key.path), key.size)
-        return self._fonts[key]
+            font = pygame.font.Font(str(key.path), key.size)
+            self._store(self._fonts, key, font)
+        return font
+
+    def get_animation(self, key, size, scale, frames_per) -> Animation:
+        variant = AnimationKey(key, size, scale, tuple(frames_per))
+        animation = self._animations.get(variant)
+        if animation is None:
+            animation = self._build_animation(variant)
+            self._store(self._animations, variant, animation)
+        return animation
+
+    def put_animation(self, key, size, scale, frames_per, frames, cell_size, digests=None) -> Animation:
+        """
+        Store frames built elsewhere (the preloader), unless that variant is cached already.
+        `digests` are the frames' pixel digests when the loader computed them. Returns the stored variant.
+        """
+        variant = AnimationKey(key, size, scale, tuple(frames_per))
+        animation = self._animations.peek(variant)
+        if animation is None:
+            animation = self._make_animation(frames, cell_size, digests)
+            self._store(self._animations, variant, animation)
+        return animation
+
+    def has_animation(self, key, size, scale, frames_per) -> bool:
+        return AnimationKey(key, size, scale, tuple(frames_per)) in self._animations
+
+    def _make_animation(self, frames, cell_size, digests=None) -> Animation:
+        return Animation(self._frames.intern_frames(frames, digests), cell_size, self._frames)
+
+    def _build_animation(self, variant: AnimationKey) -> Animation:
+        """Frames from the on-disk cache when it is warm, otherwise decoded and scaled from the sheet."""
+        key, size, scale, frames_per = variant
+        digest = cache_key(key.path, size, scale, frames_per) if FRAME_CACHE else None
+        if digest:
+            cached = load_cached_frames(digest)
+            if cached is not None:
+                return self._make_animation(*cached)
+
+        logger.info("Building animation frames for %s at size %s, scale %s", key.name, size, scale)
+        frames = load_frames(self.get_image(key), size, scale, frames_per)
+        digests = frame_digests(frames)
+        if digest:
+            store_frames(digest, frames, size * scale, digests)
+        return self._make_animation(frames, size * scale, digests)
+
+    def get_mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """Collision mask of a frame surface; one not preloaded is built now and counted as a miss."""
+        return self._masks.get(surface)
+
+    def prefetch_mask(self, surface: pygame.Surface):
+        self._masks.prefetch(surface)
+
+    def get_masks(self, frames) -> list[pygame.mask.Mask]:
+        return [self._masks.get(frame.surface) for frame in frames]
+
+    def prepare_masks(self, animation: Animation):
+        """
+        Masks of every frame of `animation`, facing either way, ahead of collisions.
+        Normally the preloader has built them; any it has not are built here, synchronously, as misses.
+        """
+        for action in range(len(animation)):
+            for facing_right in (True, False):
+                self.get_masks(animation.frames(action, facing_right))
+
+    def mask_stats(self) -> dict:
+        return self._masks.stats()
+
+    def animation_footprint(self) -> dict:
+        """
+        Per cached animation variant: frame count, bytes of its distinct surfaces, and how
+        many of those bytes are shared with other variants through the frame store.
+        """
+        variants = {variant: self._animations.peek(variant) for variant in self._animations.keys()}
+        users: dict = {}
+        for animation in variants.values():
+            for surface in animation.surfaces():
+                users[surface] = users.get(surface, 0) + 1
+
+        footprint = {}
+        for variant, animation in variants.items():
+            surfaces = animation.surfaces()
+            footprint[variant] = {
+                "frames": sum(len(animation[row]) for row in range(len(animation))),
+                "surfaces": len(surfaces),
+                "bytes": sum(s.get_pitch() * s.get_height() for s in surfaces),
+                "shared_bytes": sum(s.get_pitch() * s.get_height() for s in surfaces if users[s] > 1),
+            }
+        return footprint
+
+    # Memory budget
+    # ------------------------------------------------------------------
+    def _store(self, cache: AssetCache, key, value):
+        cache.put(key, value)
+        self._enforce_budget(keep=key)
+
+    def _enforce_budget(self, keep=None):
+        """Evict least recently used unpinned entries, across all caches, until under budget."""
+        total = self.memory_usage()
+        while total > self.budget:
+            candidates = []
+            for cache in self._caches.values():
+                oldest = cache.oldest_evictable()
+                if oldest is not None and oldest[1] != keep:
+                    candidates.append((oldest[0], cache, oldest[1]))
+            if not candidates:
+                logger.warning("Asset memory %d bytes over budget %d, nothing left to evict", total, self.budget)
+                return
+            _, cache, key = min(candidates, key=lambda c: c[0])
+            total -= cache.evict(key)
+            logger.debug("Evicted %s %s to stay within the asset budget", cache.name, key)
+
+    def pin(self, key):
+        """Never evict `key` (in whichever caches hold it)."""
+        self._pinned.add(key)
+
+    def unpin(self, key):
+        self._pinned.discard(key)
+        self._enforce_budget()
+
+    def release(self, kind: AssetKind) -> int:
+        """Evict every unpinned asset of one kind, e.g. sprite sheets between games. Returns freed bytes."""
+        freed = self._caches[kind].evict_unpinned()
+        logger.info("Released %d bytes of %s assets", freed, kind.name.lower())
+        return freed
+
+    def memory_usage(self) -> int:
+        return sum(cache.bytes for cache in self._caches.values())
 
-    def get_animation(self, key, size, scale, frames_per):
-        if key not in self._animations:
-            sheet = self.get_image(key)
-            self._animations[key] = load_frames(sheet, size, scale, frames_per)
-        return self._animations[key]
+    def stats(self) -> dict:
+        """Hits, misses, evictions and bytes per cache and per asset key."""
+        return {
+            "budget": self.budget,
+            "bytes": self.memory_usage(),
+            "frame_store": {"surfaces": len(self._frames), "bytes": self._frames.nbytes,
+                            "interned": self._frames.interned, "shared": self._frames.shared},
+            "masks": self._masks.stats(),
+            **{cache.name: cache.stats() for cache in self._caches.values()},
+        }
 
     def clear_cache(self):
-        self._images.clear()
-        self._sounds.clear()
-        self._fonts.clear()
-        self._animations.clear()
+        for cache in self._caches.values():
+            cache.clear()
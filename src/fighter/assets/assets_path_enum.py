@@ -4,6 +4,9 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parents[3]
 IMG_DIR = BASE_DIR / "assets" / "images"
 AUDIO_DIR = BASE_DIR / "assets" / "audio"
+CACHE_DIR = BASE_DIR / ".cache"
+FRAME_CACHE_DIR = CACHE_DIR / "frames"
+SOUND_CACHE_DIR = CACHE_DIR / "sounds"
 # FONT_DIR = BASE_DIR / "assets" / "fonts"
 
 
@@ -1,23 +1,142 @@
+from dataclasses import dataclass
+
 import pygame
 from src.fighter.assets.assets_path_enum import SoundKey  # wherever your SoundKey lives
+from src.fighter.core.constants import *
+from src.fighter.core.enums import SfxCategory
 from .asset_manager import AssetManager
 
 
+@dataclass(slots=True, frozen=True)
+class MixerConfig:
+    frequency: int = MIXER_FREQUENCY
+    size: int = MIXER_SIZE
+    channels: int = MIXER_CHANNELS
+    buffer: int = MIXER_BUFFER
+
+    def pre_init(self):
+        """Must run before pygame.init() (or mixer.init()) to take effect."""
+        pygame.mixer.pre_init(self.frequency, self.size, self.channels, self.buffer)
+
+    @property
+    def buffer_latency_ms(self) -> float:
+        """Time one mixing chunk covers, the minimum delay before a triggered sound is heard."""
+        return self.buffer / self.frequency * 1000
+
+
+DEFAULT_MIXER_CONFIG = MixerConfig()
+
+
+@dataclass(slots=True, frozen=True)
+class SfxProfile:
+    category: SfxCategory
+    priority: int       # higher wins when a group has to steal a voice
+    cooldown: int       # ms before the same sound may play again
+
+
+SFX_PROFILES = {
+    SoundKey.SWORD: SfxProfile(SfxCategory.COMBAT, priority=1, cooldown=SWORD_COOLDOWN),
+    SoundKey.EVIL: SfxProfile(SfxCategory.ENEMY, priority=0, cooldown=EVIL_COOLDOWN),
+    SoundKey.COIN: SfxProfile(SfxCategory.REWARD, priority=2, cooldown=COIN_COOLDOWN),
+}
+DEFAULT_SFX_PROFILE = SfxProfile(SfxCategory.COMBAT, priority=0, cooldown=0)
+
+CHANNEL_GROUPS = {
+    SfxCategory.COMBAT: SFX_COMBAT_CHANNELS,
+    SfxCategory.ENEMY: SFX_ENEMY_CHANNELS,
+    SfxCategory.REWARD: SFX_REWARD_CHANNELS,
+}
+
+
 class AudioManager:
-    def __init__(self, assets: AssetManager):
-        pygame.mixer.init()
+    """
+    Music plus a voice-limited sound-effect mixer: every category plays on its own
+    reserved channels, a sound can't retrigger within its cooldown, and a full
+    group steals the voice of its lowest-priority (then oldest) sound.
+    """
+
+    def __init__(self, assets: AssetManager, enabled: bool = True, config: MixerConfig = DEFAULT_MIXER_CONFIG):
+        # disabled audio never touches the mixer (headless runs)
+        self.enabled = enabled
         self._assets = assets
+        self._groups = {}           # category -> [Channel]
+        self._voices = {}           # Channel -> (priority, started)
+        self._last_played = {}      # SoundKey -> ticks
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        self.config = config
+        if enabled:
+            # no-op when pygame.init() already opened the mixer with the pre_init settings
+            pygame.mixer.init(config.frequency, config.size, config.channels, config.buffer)
+            self._reserve_channels()
+
+    def _reserve_channels(self):
+        reserved = sum(CHANNEL_GROUPS.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved))
+        # reserved channels are never picked by Sound.play()/find_channel()
+        pygame.mixer.set_reserved(reserved)
+        index = 0
+        for category, count in CHANNEL_GROUPS.items():
+            self._groups[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+            index += count
 
-    @staticmethod
-    def play_music(key: SoundKey, loops: int = -1, start: float = 0.0):
+    def play_music(self, key: SoundKey, loops: int = -1, start: float = 0.0):
+        if not self.enabled:
+            return
         pygame.mixer.music.load(str(key.path))
         pygame.mixer.music.play(loops, start)
 
-    @staticmethod
-    def stop_music():
+    def stop_music(self):
+        if not self.enabled:
+            return
         pygame.mixer.music.stop()
 
+    def prepare_sfx(self, key: SoundKey):
+        """Load a sound ahead of its first play."""
+        if self.enabled:
+            self._assets.get_sound(key)
+
     def play_sfx(self, key: SoundKey):
-        """Play a one‐off sound effect."""
-        sfx = self._assets.get_sound(key)
-        sfx.play()
+        """
+        Play a one‐off sound effect on its category's channels.
+        Returns the channel used, or None when the play was dropped.
+        """
+        if not self.enabled:
+            return None
+        profile = SFX_PROFILES.get(key, DEFAULT_SFX_PROFILE)
+
+        # cheapest check first, most repeated calls end here
+        now = pygame.time.get_ticks()
+        last = self._last_played.get(key)
+        if last is not None and now - last < profile.cooldown:
+            self.dropped += 1
+            return None
+
+        channel = self._pick_channel(profile)
+        if channel is None:
+            self.dropped += 1
+            return None
+
+        channel.play(self._assets.get_sound(key))
+        self._voices[channel] = (profile.priority, now)
+        self._last_played[key] = now
+        self.played += 1
+        return channel
+
+    def _pick_channel(self, profile: SfxProfile):
+        """A free channel of the group, else the voice to steal, else None."""
+        group = self._groups[profile.category]
+        for channel in group:
+            if not channel.get_busy():
+                return channel
+
+        # steal the lowest priority voice, the oldest among equals, if it doesn't outrank us
+        victim = min(group, key=lambda ch: self._voices.get(ch, (0, 0)))
+        if self._voices.get(victim, (0, 0))[0] > profile.priority:
+            return None
+        self.stolen += 1
+        return victim
+
+    def stats(self) -> dict:
+        return {"played": self.played, "dropped": self.dropped, "stolen": self.stolen}
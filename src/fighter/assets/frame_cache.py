@@ -0,0 +1,108 @@
+# Persistent cache of processed (trimmed + scaled) animation frames.
+#
+# Each entry is two files in FRAME_CACHE_DIR named after a digest of the build inputs:
+#   <digest>.bin   raw RGBA pixels of every frame, back to back
+#   <digest>.json  index: cell size and, per row, each frame's size, offset, byte start and
+#                  pixel digest (for the FrameStore, so warm loads never rehash)
+# The .bin is memory-mapped on load and surfaces are built straight from it.
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+
+import pygame
+from src.fighter.assets.assets_path_enum import FRAME_CACHE_DIR
+from src.fighter.assets.frame_store import frame_digests
+from src.fighter.assets.sprite_loader import Frame
+from src.fighter.core.constants import FRAME_CACHE_VERSION
+from logger import MyLogger
+
+logger = MyLogger().channel("assets")
+
+PIXEL_FORMAT = "RGBA"
+BYTES_PER_PIXEL = 4
+
+
+def cache_key(path: Path, size: int, scale: int, frames_per: list[int]) -> str:
+    """Digest of everything the processed frames depend on, including the sheet's mtime."""
+    stat = os.stat(path)
+    raw = f"{FRAME_CACHE_VERSION}|{path}|{stat.st_mtime_ns}|{stat.st_size}|{size}|{scale}|{tuple(frames_per)}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _surface(buffer, width: int, height: int, convert: bool) -> pygame.Surface:
+    if width == 0 or height == 0:
+        # empty cell on the sheet
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+    surf = pygame.image.frombuffer(buffer, (width, height), PIXEL_FORMAT)
+    if convert and pygame.display.get_surface() is not None:
+        # copy into the display format; without a display the surface keeps using the mapping
+        surf = surf.convert_alpha()
+    return surf
+
+
+def load_cached_frames(key: str, cache_dir: Path = FRAME_CACHE_DIR, convert: bool = True):
+    """
+    Returns (frames, cell_size, pixel digests) or None on a miss or unreadable entry.
+    Pass convert=False off the main thread, display conversion must happen on it.
+    """
+    index_path = cache_dir / f"{key}.json"
+    data_path = cache_dir / f"{key}.bin"
+    if not (index_path.exists() and data_path.exists()):
+        return None
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        with open(data_path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if index["bytes"] else b""
+        view = memoryview(mapping)
+
+        frames = []
+        digests = []
+        for row in index["rows"]:
+            frames.append([
+                Frame(_surface(view[start:start + w * h * BYTES_PER_PIXEL], w, h, convert), (x, y))
+                for w, h, x, y, start, _ in row
+            ])
+            digests.append([bytes.fromhex(digest) for *_, digest in row])
+        return frames, index["cell"], digests
+    except (OSError, ValueError, KeyError, pygame.error) as e:
+        logger.warning("Ignoring unreadable frame cache entry %s: %s", key, e)
+        return None
+
+
+def store_frames(key: str,
+                 frames: list[list[Frame]],
+                 cell_size: int,
+                 digests: list[list[bytes]] = None,
+                 cache_dir: Path = FRAME_CACHE_DIR
+                 ):
+    """Write frames to the cache. Failures are logged, the game runs fine without the cache."""
+    if digests is None:
+        digests = frame_digests(frames)
+    rows = []
+    start = 0
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        data_tmp = cache_dir / f"{key}.bin.tmp"
+        with open(data_tmp, "wb") as f:
+            for row, row_digests in zip(frames, digests):
+                entries = []
+                for frame, digest in zip(row, row_digests):
+                    w, h = frame.surface.get_size()
+                    if w and h:
+                        f.write(pygame.image.tobytes(frame.surface, PIXEL_FORMAT))
+                    entries.append((w, h, frame.offset[0], frame.offset[1], start, digest.hex()))
+                    start += w * h * BYTES_PER_PIXEL
+                rows.append(entries)
+
+        index_tmp = cache_dir / f"{key}.json.tmp"
+        with open(index_tmp, "w") as f:
+            json.dump({"cell": cell_size, "bytes": start, "rows": rows}, f)
+
+        # index last, so a complete index always points at complete pixels
+        os.replace(data_tmp, cache_dir / f"{key}.bin")
+        os.replace(index_tmp, cache_dir / f"{key}.json")
+    except OSError as e:
+        logger.warning("Could not write frame cache entry %s: %s", key, e)
@@ -0,0 +1,67 @@
+import hashlib
+import weakref
+
+import pygame
+from src.fighter.assets.sprite_loader import Frame
+
+
+def pixel_digest(surface: pygame.Surface) -> bytes:
+    """Content digest of a surface's size and RGBA pixels, safe to compute off the main thread."""
+    width, height = surface.get_size()
+    digest = hashlib.blake2b(f"{width}x{height}".encode(), digest_size=16)
+    if width and height:
+        digest.update(pygame.image.tobytes(surface, "RGBA"))
+    return digest.digest()
+
+
+def frame_digests(frames: list[list[Frame]]) -> list[list[bytes]]:
+    return [[pixel_digest(f.surface) for f in row] for row in frames]
+
+
+class FrameStore:
+    """
+    Content-addressed pool of frame surfaces shared by every animation variant.
+    Frames with identical pixels are stored once; a surface stays in the pool
+    only while some animation still uses it.
+    Digests can be passed in when they were computed elsewhere (a loader thread, the frame
+    cache index), mirrored surfaces derive theirs from the source, so neither is hashed here.
+    """
+
+    def __init__(self):
+        self._surfaces = weakref.WeakValueDictionary()    # digest -> Surface
+        self._digests = weakref.WeakKeyDictionary()       # Surface -> digest
+        self.interned = 0
+        self.shared = 0
+
+    def intern(self, surface: pygame.Surface, digest: bytes = None) -> pygame.Surface:
+        """The pooled surface with these pixels, `surface` itself if it is the first."""
+        if digest is None:
+            digest = pixel_digest(surface)
+        self.interned += 1
+        existing = self._surfaces.get(digest)
+        if existing is not None:
+            self.shared += 1
+            return existing
+        self._surfaces[digest] = surface
+        self._digests[surface] = digest
+        return surface
+
+    def intern_mirror(self, source: pygame.Surface, flipped: pygame.Surface) -> pygame.Surface:
+        """Intern the horizontal flip of the pooled `source`; equal sources have equal flips."""
+        digest = self._digests.get(source)
+        if digest is not None:
+            digest = hashlib.blake2b(b"mirror" + digest, digest_size=16).digest()
+        return self.intern(flipped, digest)
+
+    def intern_frames(self, frames: list[list[Frame]], digests: list[list[bytes]] = None) -> list[list[Frame]]:
+        if digests is None:
+            digests = frame_digests(frames)
+        return [[Frame(self.intern(f.surface, d), f.offset) for f, d in zip(row, row_digests)]
+                for row, row_digests in zip(frames, digests)]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(s.get_pitch() * s.get_height() for s in self._surfaces.values())
+
+    def __len__(self):
+        return len(self._surfaces)
@@ -0,0 +1,27 @@
+# Everything the game loads, in the order the preloader should fetch it.
+from dataclasses import dataclass
+
+from src.fighter.assets.assets_path_enum import InGameImageKey, EntityImageKey, SoundKey
+from src.fighter.core.constants import *
+from src.fighter.core.enums import AssetKind
+
+
+@dataclass(slots=True, frozen=True)
+class ManifestEntry:
+    kind: AssetKind
+    key: object
+    # AssetManager.get_animation arguments after the key: (size, scale, frames_per)
+    params: tuple = ()
+
+
+DEFAULT_MANIFEST = (
+    # needed first: playing starts on these
+    ManifestEntry(AssetKind.ANIMATION, EntityImageKey.PLAYER_SPRITE, (PLAYER_SIZE, PLAYER_SCALE, tuple(PLAYER_PER_ACTION))),
+    ManifestEntry(AssetKind.ANIMATION, EntityImageKey.WIZARD, (WIZARD_SIZE, WIZARD_SCALE, tuple(WIZARD_PER_ACTION))),
+    ManifestEntry(AssetKind.IMAGE, EntityImageKey.PIG),
+    ManifestEntry(AssetKind.SOUND, SoundKey.SWORD),
+    ManifestEntry(AssetKind.SOUND, SoundKey.EVIL),
+    ManifestEntry(AssetKind.SOUND, SoundKey.COIN),
+    # other screens (BG_MENU is loaded with the background, the menu draws it on the first frame)
+    ManifestEntry(AssetKind.IMAGE, InGameImageKey.INSTRUCTION),
+)
@@ -0,0 +1,66 @@
+import time
+import weakref
+
+import pygame
+from logger import MyLogger
+
+logger = MyLogger().channel("assets")
+
+
+def mask_bytes(mask: pygame.mask.Mask) -> int:
+    # bit rows padded to 64-bit words
+    width, height = mask.get_size()
+    return (width + 63) // 64 * 8 * height
+
+
+class MaskCache:
+    """
+    Collision masks keyed by frame surface, each built once. Frames are interned in the
+    FrameStore and mirrored rows are surfaces of their own, so one entry per surface covers
+    every frame and orientation; an entry goes away with its surface.
+    Masks are meant to be built ahead (`prefetch`, from the preloader); one built on a `get`
+    stalls the caller, so it is counted and logged as a miss.
+    """
+
+    def __init__(self):
+        self._masks = weakref.WeakKeyDictionary()     # Surface -> Mask
+        self.built = 0
+        self.misses = 0
+        self.build_time = 0.0
+
+    def get(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        mask = self._masks.get(surface)
+        if mask is None:
+            self.misses += 1
+            mask = self._build(surface)
+            if logger.debug_enabled:
+                logger.debug("Mask of a %dx%d frame built on demand", *surface.get_size())
+        return mask
+
+    def prefetch(self, surface: pygame.Surface):
+        """Build the mask of `surface` unless it exists already, not counted as a miss."""
+        if surface not in self._masks:
+            self._build(surface)
+
+    def _build(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        start = time.perf_counter()
+        mask = self._masks[surface] = pygame.mask.from_surface(surface)
+        self.build_time += time.perf_counter() - start
+        self.built += 1
+        return mask
+
+    def __len__(self):
+        return len(self._masks)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(mask_bytes(mask) for mask in self._masks.values())
+
+    def stats(self) -> dict:
+        return {
+            "masks": len(self._masks),
+            "bytes": self.nbytes,
+            "built": self.built,
+            "misses": self.misses,
+            "build_ms": self.build_time * 1000,
+        }
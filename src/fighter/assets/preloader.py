@@ -0,0 +1,212 @@
+import io
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from src.fighter.assets.asset_manager import AssetManager
+from src.fighter.assets.frame_cache import cache_key, load_cached_frames, store_frames
+from src.fighter.assets.frame_store import frame_digests
+from src.fighter.assets.manifest import DEFAULT_MANIFEST, ManifestEntry
+from src.fighter.assets.sprite_loader import Frame, load_frames
+from src.fighter.assets.sound_cache import read_pcm, store_pcm
+from src.fighter.core.constants import FRAME_CACHE, PRELOAD_WORKERS, PRELOAD_FRAME_BUDGET
+from src.fighter.core.enums import AssetKind
+from logger import MyLogger
+
+logger = MyLogger().channel("assets")
+
+
+def _read(entry: ManifestEntry):
+    """
+    Worker side: file IO and decoding only, nothing that touches the display or mixer.
+    Returns what the main thread needs to finish the entry.
+    """
+    path = entry.key.path
+    if entry.kind == AssetKind.IMAGE:
+        with open(path, "rb") as f:
+            return pygame.image.load(io.BytesIO(f.read()), path.name)
+
+    if entry.kind == AssetKind.ANIMATION:
+        size, scale, frames_per = entry.params
+        digest = cache_key(path, size, scale, frames_per) if FRAME_CACHE else None
+        if digest:
+            cached = load_cached_frames(digest, convert=False)
+            if cached is not None:
+                return cached
+        with open(path, "rb") as f:
+            sheet = pygame.image.load(io.BytesIO(f.read()), path.name)
+        frames = load_frames(sheet, size, scale, frames_per)
+        # hashed here rather than when the main thread interns the frames
+        pixel_digests = frame_digests(frames)
+        if digest:
+            store_frames(digest, frames, size * scale, pixel_digests)
+        return frames, size * scale, pixel_digests
+
+    if entry.kind == AssetKind.SOUND:
+        # already in the mixer format when cached, else the encoded file
+        pcm = read_pcm(path)
+        if pcm is not None:
+            return True, pcm
+        with open(path, "rb") as f:
+            return False, f.read()
+
+    raise ValueError(f"Unknown asset kind {entry.kind}")
+
+
+class AssetPreloader:
+    """
+    Loads a manifest in the background: a thread pool reads and decodes files,
+    `poll` finishes them on the main thread (display conversion, mixer objects)
+    within a per-frame time budget and hands them to the AssetManager.
+    Collision masks of the loaded animations, both orientations, are built last in the same budget.
+    """
+
+    def __init__(self,
+                 assets: AssetManager,
+                 manifest: tuple = DEFAULT_MANIFEST,
+                 workers: int = PRELOAD_WORKERS,
+                 load_sounds: bool = True
+                 ):
+        self.assets = assets
+        self.workers = workers
+        self._entries = tuple(e for e in manifest if load_sounds or e.kind != AssetKind.SOUND)
+        self._start(self._entries)
+
+    def _start(self, entries):
+        self.manifest = entries
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preload")
+        self._futures = [self._executor.submit(_read, entry) for entry in self.manifest]
+        self._next = 0      # manifest index of the next entry to finish
+        self._result = None     # its worker result while it is finished over several polls
+        self._converted = 0     # animation frames of it already in the display format
+        self._mask_rows = deque()       # (animation, action, facing_right) still without masks
+        self._mask_surfaces = deque()   # frames of rows taken from _mask_rows, one mask each
+        # masks the manifest's animations will need, known up front so progress never goes back
+        self._mask_total = sum(self._mask_count(entry) for entry in entries)
+        self._masks_built = 0
+        self.started = time.perf_counter()
+
+    def requeue(self, kind: AssetKind):
+        """Load the `kind` entries again in the background, e.g. animations released between games."""
+        self.finish()
+        self._start(tuple(e for e in self._entries if e.kind == kind))
+
+    @property
+    def loaded(self) -> bool:
+        return self._next >= len(self.manifest)
+
+    @property
+    def done(self) -> bool:
+        return self.loaded and not (self._mask_rows or self._mask_surfaces)
+
+    @property
+    def progress(self) -> float:
+        """Finished share of the work, 0..1: manifest entries plus the collision masks built after them."""
+        if self.done:
+            return 1.0
+        total = len(self.manifest) + self._mask_total
+        return min(1.0, (self._next + self._masks_built) / total)
+
+    @staticmethod
+    def _mask_count(entry: ManifestEntry) -> int:
+        # one mask per frame, facing either way
+        if entry.kind != AssetKind.ANIMATION:
+            return 0
+        size, scale, frames_per = entry.params
+        return 2 * sum(frames_per)
+
+    def poll(self, budget: float = PRELOAD_FRAME_BUDGET):
+        """Finish ready entries, in manifest order, until `budget` seconds are used."""
+        deadline = time.perf_counter() + budget
+        while not self.loaded and (self._result is not None or self._futures[self._next].done()):
+            if not self._finish(self._next, deadline) or time.perf_counter() >= deadline:
+                return
+        if self.loaded:
+            self._build_masks(deadline)
+
+    def finish(self):
+        """Block until everything is loaded, e.g. when gameplay starts before preloading ended."""
+        while not self.loaded:
+            if self._result is None:
+                self._futures[self._next].exception()     # waits, errors are handled in _finish
+            self._finish(self._next)
+        self._build_masks()
+
+    def _finish(self, index: int, deadline: float = None) -> bool:
+        """
+        Hand entry `index` to the AssetManager. Returns False when `deadline` passed part way
+        through converting an animation, the next call carries on where this one stopped.
+        """
+        entry = self.manifest[index]
+        if self._result is None:
+            future, self._futures[index] = self._futures[index], None
+            try:
+                # the future would otherwise keep the decoded surfaces alive after an eviction
+                self._result = future.result()
+            except Exception as e:
+                # the asset will be loaded on demand instead
+                logger.warning("Preloading %s failed: %s", entry.key, e)
+                self._mask_total -= self._mask_count(entry)
+                self._advance()
+                return True
+            self._converted = 0
+        result = self._result
+
+        if entry.kind == AssetKind.IMAGE:
+            if not self.assets.has_image(entry.key):
+                self.assets.put_image(entry.key, result.convert_alpha())
+        elif entry.kind == AssetKind.ANIMATION:
+            if not self.assets.has_animation(entry.key, *entry.params):
+                frames, cell_size, pixel_digests = result
+                if not self._convert(frames, deadline):
+                    return False
+                animation = self.assets.put_animation(entry.key, *entry.params, frames, cell_size, pixel_digests)
+                self._mask_rows.extend((animation, action, facing_right)
+                                       for action in range(len(animation)) for facing_right in (True, False))
+            else:
+                self._mask_total -= self._mask_count(entry)
+        elif entry.kind == AssetKind.SOUND:
+            if not self.assets.has_sound(entry.key):
+                is_pcm, data = result
+                if is_pcm:
+                    sound = pygame.mixer.Sound(buffer=data)
+                else:
+                    sound = pygame.mixer.Sound(file=io.BytesIO(data))
+                    store_pcm(entry.key.path, sound)
+                self.assets.put_sound(entry.key, sound)
+        self._advance()
+        return True
+
+    def _convert(self, frames, deadline) -> bool:
+        """Convert frames to the display format in place until `deadline`, True once all are."""
+        cells = [(row, i) for row in frames for i in range(len(row))]
+        while self._converted < len(cells):
+            row, i = cells[self._converted]
+            frame = row[i]
+            if frame.surface.get_width() and frame.surface.get_height():
+                row[i] = Frame(frame.surface.convert_alpha(), frame.offset)
+            self._converted += 1
+            if deadline is not None and time.perf_counter() >= deadline and self._converted < len(cells):
+                return False
+        return True
+
+    def _build_masks(self, deadline: float = None):
+        """Build queued collision masks until `deadline`, at least one step per call."""
+        while self._mask_rows or self._mask_surfaces:
+            if self._mask_surfaces:
+                self.assets.prefetch_mask(self._mask_surfaces.popleft())
+                self._masks_built += 1
+            else:
+                # mirrors the row when facing left
+                animation, action, facing_right = self._mask_rows.popleft()
+                self._mask_surfaces.extend(frame.surface for frame in animation.frames(action, facing_right))
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+
+    def _advance(self):
+        self._result = None
+        self._next += 1
+        if self.loaded:
+            self._executor.shutdown(wait=False)
+            logger.info("Preloaded %d assets in %.2fs", len(self.manifest), time.perf_counter() - self.started)
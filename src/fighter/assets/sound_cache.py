@@ -0,0 +1,59 @@
+# Persistent cache of sound effects decoded to the mixer's native sample format.
+#
+# Entries are raw PCM files in SOUND_CACHE_DIR named after a digest of the source file
+# (path, mtime, size) and the mixer format, loaded with pygame.mixer.Sound(buffer=...).
+import hashlib
+import os
+from pathlib import Path
+
+import pygame
+from src.fighter.assets.assets_path_enum import SOUND_CACHE_DIR
+from src.fighter.core.constants import SOUND_CACHE, SOUND_CACHE_VERSION
+from logger import MyLogger
+
+logger = MyLogger().channel("assets")
+
+
+def cache_path(path: Path, cache_dir: Path = SOUND_CACHE_DIR):
+    """Cache file for `path` in the current mixer format, None when the mixer is not initialised."""
+    mixer_format = pygame.mixer.get_init()
+    if mixer_format is None:
+        return None
+    stat = os.stat(path)
+    raw = f"{SOUND_CACHE_VERSION}|{path}|{stat.st_mtime_ns}|{stat.st_size}|{mixer_format}"
+    return cache_dir / f"{hashlib.sha1(raw.encode()).hexdigest()}.pcm"
+
+
+def read_pcm(path: Path):
+    """Cached PCM bytes for the sound file, or None. Safe to call off the main thread."""
+    pcm = cache_path(path) if SOUND_CACHE else None
+    if pcm is None or not pcm.exists():
+        return None
+    try:
+        return pcm.read_bytes()
+    except OSError as e:
+        logger.warning("Ignoring unreadable sound cache entry %s: %s", pcm.name, e)
+        return None
+
+
+def store_pcm(path: Path, sound: pygame.mixer.Sound):
+    pcm = cache_path(path) if SOUND_CACHE else None
+    if pcm is None:
+        return
+    try:
+        pcm.parent.mkdir(parents=True, exist_ok=True)
+        tmp = pcm.with_suffix(".tmp")
+        tmp.write_bytes(sound.get_raw())
+        os.replace(tmp, pcm)
+    except OSError as e:
+        logger.warning("Could not write sound cache entry %s: %s", pcm.name, e)
+
+
+def load_sound(path: Path) -> pygame.mixer.Sound:
+    """Sound from the PCM cache when warm, otherwise decoded from `path` and cached."""
+    data = read_pcm(path)
+    if data is not None:
+        return pygame.mixer.Sound(buffer=data)
+    sound = pygame.mixer.Sound(str(path))
+    store_pcm(path, sound)
+    return sound
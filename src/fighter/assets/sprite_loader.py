@@ -1,17 +1,34 @@
+from dataclasses import dataclass
+
 import pygame
 
 
-def load_frames(sheet: pygame.Surface, size: int, scale: int, frames_per: list[int]) -> list[list[pygame.Surface]]:
+@dataclass(slots=True, frozen=True)
+class Frame:
+    """One trimmed animation frame and where its top-left sits inside the scaled cell."""
+    surface: pygame.Surface
+    offset: tuple[int, int]
+
+
+def load_frames(sheet: pygame.Surface, size: int, scale: int, frames_per: list[int]) -> list[list[Frame]]:
     """
     Generic tilesheet loader: for each row (i.e. an animation),
     grab `frames_per[row]` frames of size `size` and scale them up.
+    Each frame is cropped to its visible pixels before scaling, the crop
+    position is kept as the frame's offset within the `size * scale` cell.
     Returns a list of frame-lists.
     """
-    animation: list[list[pygame.Surface]] = []
+    animation: list[list[Frame]] = []
     for row, count in enumerate(frames_per):
-        row_frames: list[pygame.Surface] = []
+        row_frames: list[Frame] = []
         for i in range(count):
             sub = sheet.subsurface(pygame.Rect(i * size, row * size, size, size))
-            row_frames.append(pygame.transform.scale(sub, (size * scale, size * scale)))
+            # most of a cell is transparent padding, only keep what is drawn
+            bounds = sub.get_bounding_rect()
+            trimmed = sub.subsurface(bounds)
+            row_frames.append(Frame(
+                pygame.transform.scale(trimmed, (bounds.width * scale, bounds.height * scale)),
+                (bounds.x * scale, bounds.y * scale)
+            ))
         animation.append(row_frames)
     return animation
@@ -0,0 +1,99 @@
+import os
+
+# headless by default, pass --device to measure through the real audio output
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass
+
+import pygame
+from src.fighter.assets.audio_manager import MixerConfig
+from src.fighter.core.constants import MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS
+
+# length of the probe sound in whole mixing chunks
+PROBE_CHUNKS = 8
+BUFFERS = (256, 512, 1024, 2048)
+
+
+@dataclass(slots=True)
+class LatencyResult:
+    config: MixerConfig
+    trigger_ms: float       # cost of the Channel.play call itself
+    start_ms: float         # median trigger-to-first-mix delay, signed
+    worst_ms: float
+
+    @property
+    def playback_ms(self) -> float:
+        """Median trigger-to-playback estimate: the first mixed chunk is heard one chunk after it is mixed."""
+        return self.start_ms + self.config.buffer_latency_ms
+
+    def row(self) -> str:
+        return (f"{self.config.buffer:>6} {self.config.frequency:>6} "
+                f"{self.config.buffer_latency_ms:>9.2f} {self.trigger_ms:>9.3f} "
+                f"{self.start_ms:>9.2f} {self.worst_ms:>9.2f} {self.playback_ms:>11.2f}")
+
+
+def _probe_sound(config: MixerConfig) -> pygame.mixer.Sound:
+    """Silent PCM of exactly PROBE_CHUNKS mixing chunks in the mixer's format."""
+    frames = config.buffer * PROBE_CHUNKS
+    return pygame.mixer.Sound(buffer=bytes(frames * config.channels * abs(config.size) // 8))
+
+
+def measure(config: MixerConfig, trials: int) -> LatencyResult:
+    """
+    The mixer mixes one `buffer`-sample chunk each time the device pulls one. A triggered sound
+    starts in the next chunk pulled, and its channel frees as soon as the chunk holding its
+    last sample is mixed (not when that is heard). With a probe of exactly PROBE_CHUNKS chunks,
+    busy time = start delay + (PROBE_CHUNKS - 1) chunks, which gives the signed delay from the
+    trigger to the first device pull that mixes the sound. It lies in [0, one chunk) up to the
+    polling granularity; values are not clamped, so a skewed device clock shows up.
+    The playback estimate adds the chunk the device plays before the new one;
+    latency below SDL (driver, hardware) is not included.
+    """
+    config.pre_init()
+    pygame.mixer.init()
+    try:
+        sound = _probe_sound(config)
+        channel = pygame.mixer.Channel(0)
+        triggers, delays = [], []
+        for _ in range(trials):
+            start = time.perf_counter()
+            channel.play(sound)
+            triggered = time.perf_counter()
+            while channel.get_busy():
+                time.sleep(0.0005)
+            busy = time.perf_counter() - start
+            triggers.append((triggered - start) * 1000)
+            delays.append(busy * 1000 - (PROBE_CHUNKS - 1) * config.buffer_latency_ms)
+        return LatencyResult(config=config,
+                             trigger_ms=statistics.median(triggers),
+                             start_ms=statistics.median(delays),
+                             worst_ms=max(delays)
+                             )
+    finally:
+        pygame.mixer.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure sound trigger-to-playback latency per mixer configuration.")
+    parser.add_argument("--buffers", type=int, nargs="+", default=BUFFERS)
+    parser.add_argument("--frequency", type=int, default=MIXER_FREQUENCY)
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--device", action="store_true", help="use the real audio device instead of the dummy driver")
+    args = parser.parse_args(argv)
+    if not args.device:
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    results = []
+    print(f"{'buffer':>6} {'freq':>6} {'chunk_ms':>9} {'play_ms':>9} {'start_ms':>9} {'worst_ms':>9} {'playback_ms':>11}")
+    for buffer in args.buffers:
+        result = measure(MixerConfig(args.frequency, MIXER_SIZE, MIXER_CHANNELS, buffer), args.trials)
+        print(result.row())
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from array import array
+
+from .constants import FRAME_DURATION
+
+
+class Animator:
+    """
+    Animation state of every animated entity as parallel arrays of (clip, length, frame, elapsed),
+    advanced together once per simulation step. Entities keep a slot index and read their frame
+    from here, so animation follows simulated time only and replays identically.
+    """
+    __slots__ = ("frame_duration", "clip", "length", "frame", "elapsed", "paused")
+
+    def __init__(self, frame_duration: float = FRAME_DURATION):
+        self.frame_duration = frame_duration    # milliseconds per frame
+        self.clip = array("i")
+        self.length = array("i")                # frames in the clip
+        self.frame = array("i")
+        self.elapsed = array("d")               # simulated milliseconds since the last frame advance
+        self.paused = array("b")                # 1 while the entity is dormant
+
+    def add(self, clip: int, length: int) -> int:
+        """
+        New animation starting at frame 0, returns its slot. Slots live as long as the game:
+        pooled entities keep theirs and pause it while parked.
+        """
+        self.clip.append(clip)
+        self.length.append(length)
+        self.frame.append(0)
+        self.elapsed.append(0.0)
+        self.paused.append(0)
+        return len(self.clip) - 1
+
+    def set_clip(self, slot: int, clip: int, length: int):
+        """Switch clips without restarting, the frame wraps to the new length on the next advance."""
+        self.clip[slot] = clip
+        self.length[slot] = length
+
+    def pause(self, slot: int, paused: bool = True):
+        self.paused[slot] = paused
+
+    def restart(self, slot: int):
+        self.frame[slot] = 0
+        self.elapsed[slot] = 0.0
+
+    def advance(self, dt: float):
+        """Step every live animation by dt simulated seconds."""
+        step = dt * 1000
+        duration = self.frame_duration
+        length, frame, elapsed, paused = self.length, self.frame, self.elapsed, self.paused
+        for slot in range(len(length)):
+            n = length[slot]
+            if not n or paused[slot]:
+                continue
+            t = elapsed[slot] + step
+            if t > duration:
+                elapsed[slot] = 0.0
+                frame[slot] = (frame[slot] + 1) % n
+            else:
+                elapsed[slot] = t
+
+    def __len__(self):
+        return len(self.clip)
+
+    def stats(self) -> dict:
+        return {"animations": len(self), "paused": sum(self.paused)}
@@ -0,0 +1,50 @@
+from .constants import SIM_DT, TIME_SCALE, MAX_FRAME_TIME, MAX_STEPS_PER_FRAME
+
+
+class FixedStepClock:
+    """
+    Accumulates real frame time and hands it out as fixed simulation steps.
+    `alpha` is how far the renderer is between the last two steps (0..1).
+    """
+    __slots__ = ("step", "time_scale", "max_frame_time", "max_steps",
+                 "accumulator", "ticks", "sim_time")
+
+    def __init__(self,
+                 step: float = SIM_DT,
+                 time_scale: float = TIME_SCALE,
+                 max_frame_time: float = MAX_FRAME_TIME,
+                 max_steps: int = MAX_STEPS_PER_FRAME
+                 ):
+        self.step = step
+        self.time_scale = time_scale
+        self.max_frame_time = max_frame_time
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.sim_time = 0.0
+
+    def advance(self, frame_time: float) -> int:
+        """Feed `frame_time` real seconds, return how many steps to simulate."""
+        # clamp hitches so one slow frame can't queue up a burst of steps
+        self.accumulator += min(frame_time, self.max_frame_time) * self.time_scale
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            # can't keep up: drop the backlog instead of spiralling
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    def tick(self):
+        """Record that one step was simulated."""
+        self.ticks += 1
+        self.sim_time += self.step
+
+    def reset(self):
+        """Drop pending time, e.g. after a state switch."""
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self) -> float:
+        return min(self.accumulator / self.step, 1.0)
@@ -4,6 +4,11 @@
 #------------------------------------------------------------------------
 DEBUG = False
 
+# Logging
+LOG_LEVEL = "DEBUG" if DEBUG else "INFO"
+# per-subsystem overrides, e.g. {"enemies": "DEBUG"}; subsystems are the MyLogger channels
+LOG_SUBSYSTEM_LEVELS = {}
+
 FRAMES = 60
 CAPTION = "Fighter Game"
 CENTER = (0, 0)
@@ -13,6 +18,67 @@ GROUND = 100
 MIN_X = -200
 REQUIRED_KILL_LEVEL = 5
 
+# Simulation
+# Velocities and speeds below are in pixels per simulation tick.
+SIM_RATE = 60
+SIM_DT = 1 / SIM_RATE
+TIME_SCALE = 1.0
+MAX_FRAME_TIME = 0.25
+MAX_STEPS_PER_FRAME = 8
+HEADLESS_TICKS = 10000
+
+# Profiling
+PROFILE = DEBUG
+PROFILE_CAPACITY = 600          # frames kept in the ring buffer
+PROFILE_HITCH_LOG = 100
+PROFILE_DUMP_PATH = "frame_profile"   # written as .csv and .json on exit
+PROFILE_FONT_SIZE = 20
+PROFILE_MARGIN = 10
+
+# Asset caches
+FRAME_CACHE = True          # keep processed animation frames on disk between runs
+FRAME_CACHE_VERSION = 2     # bump when the frame processing changes
+ASSET_MEMORY_BUDGET = 256 * 1024 * 1024     # bytes, least recently used assets are evicted above it
+
+# Preloading
+PRELOAD_WORKERS = 4
+PRELOAD_FRAME_BUDGET = 0.004    # seconds of main-thread finishing work per frame
+
+# Audio
+# mixer setup, applied with pygame.mixer.pre_init before pygame.init
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16            # signed 16-bit samples
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512          # samples per mixing chunk, lower means less latency
+SOUND_CACHE = True          # keep sound effects decoded to the mixer format on disk
+SOUND_CACHE_VERSION = 1
+# reserved mixer channels per sound-effect category
+SFX_COMBAT_CHANNELS = 2
+SFX_ENEMY_CHANNELS = 2
+SFX_REWARD_CHANNELS = 3
+# minimum time between two plays of the same sound, in ms
+SWORD_COOLDOWN = 250
+EVIL_COOLDOWN = 400
+COIN_COOLDOWN = 40
+
+# Text
+TEXT_CACHE_SIZE = 128
+GLYPH_CHARS = "0123456789+-"
+
+# Score popups
+POPUP_CAPACITY = 256        # live popups at once, the oldest is reused beyond that
+POPUP_LIFETIME = 0.8        # seconds
+POPUP_RISE_SPEED = 30       # px/sec upward
+POPUP_FADE_START = 0.8      # share of the lifetime before fading out
+POPUP_FADE_STEPS = 16       # pre-faded copies of each popup text
+POPUP_TEXTS = 32            # popup texts whose faded copies are kept, least recently used dropped
+POPUP_COLOR = (255, 255, 0)
+
+# Presentation
+# partial display updates above this share of the screen (or rect count) fall back to a flip
+PRESENT_MAX_AREA = 0.5
+PRESENT_MAX_RECTS = 32
+
 #Entities
 #------------------------------------------------------------------------
 
@@ -48,6 +114,15 @@ ENEMY_MINIMUM_VELOCITY = 5
 ENEMY_BASE_VELOCITY = 4
 
 ENEMY_DEFAULT_SCORE = 1
+SPAWN_PER_TICK = 2          # planned enemies handed out per simulation step
+SPAWN_FRAME_BUDGET = 0.001  # seconds per quiet frame for building pooled enemies ahead of a wave
+# enemies this far past the right edge (beyond their sprite's reach) only move, no animation or draw
+ENEMY_DORMANT_MARGIN = 100
+
+# Horde (stress) mode: array-backed enemies in waves of HORDE_WAVE
+HORDE_MODE = False
+HORDE_WAVE = 2000
+HORDE_SPACING = 4           # extra spawn spread per enemy so a wave does not arrive stacked
 
 # Wizard
 #----------------------
@@ -101,6 +176,9 @@ MM_OPTIONS = ["Start Game", "Instructions", "Quit"]
 MM_Y_OFFSET = 50
 MM_OPTIONS_Y_OFFSET = 150
 MM_OPTIONS_DISTANCE = 60
+MM_PROGRESS_W = 300
+MM_PROGRESS_H = 8
+MM_PROGRESS_Y_OFFSET = 60        # below the last option
 
 #Instructions
 #------------------------------------------
@@ -18,6 +18,28 @@ class FighterActionNUM(IntEnum):
     LIE = 6
 
 
+class AssetKind(Enum):
+    IMAGE = auto()
+    ANIMATION = auto()
+    SOUND = auto()
+    FONT = auto()
+
+
+class SfxCategory(Enum):
+    COMBAT = auto()
+    ENEMY = auto()
+    REWARD = auto()
+
+
+class RenderLayer(IntEnum):
+    """Draw order of RenderQueue submissions, lowest first."""
+    BACKGROUND = 0
+    PLAYER = 10
+    ENEMIES = 20
+    HUD = 30
+    POPUPS = 40
+
+
 class RecordField(Enum):
     TIMESTAMP = "timestamp"
     SCORE     = "score"
@@ -0,0 +1,60 @@
+from typing import Callable
+
+
+class Pool:
+    """
+    Free list of reusable objects. `acquire(*args)` hands out a released instance re-initialised
+    with `reset(*args)`, or builds one with `factory(*args)` when none is free.
+    Free instances are `park()`ed, released ones and those built ahead by `reserve` alike.
+    Counts what it created so churn over a long session can be checked against the high-water mark.
+    """
+    __slots__ = ("name", "factory", "_free", "created", "acquired", "in_use", "high_water")
+
+    def __init__(self, name: str, factory: Callable):
+        self.name = name
+        self.factory = factory
+        self._free = []
+        self.created = 0
+        self.acquired = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def acquire(self, *args):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+        else:
+            obj = self.factory(*args)
+            self.created += 1
+        self.acquired += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def reserve(self, count: int, *args):
+        """Build instances ahead of time until at least `count` are free, `args` are the factory's."""
+        while len(self._free) < count:
+            obj = self.factory(*args)
+            obj.park()
+            self._free.append(obj)
+            self.created += 1
+
+    def release(self, obj):
+        obj.park()
+        self._free.append(obj)
+        self.in_use -= 1
+
+    def __len__(self):
+        """Instances the pool owns, handed out or free."""
+        return self.in_use + len(self._free)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self),
+            "in_use": self.in_use,
+            "free": len(self._free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "acquired": self.acquired,
+        }
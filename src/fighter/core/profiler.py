@@ -0,0 +1,203 @@
+import csv
+import json
+import time
+from array import array
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+
+import pygame
+from .constants import (FRAMES, PROFILE_CAPACITY, PROFILE_HITCH_LOG, PROFILE_FONT_SIZE,
+                        PROFILE_MARGIN, WHITE, BLACK, RED)
+
+# phase -> parent phase (None for the top-level phases of Game.run)
+PHASES = {
+    "events": None,
+    "handle_events": None,
+    "update": None,
+    "draw": None,
+    "present": None,
+    # Playing.update
+    "spawn": "update",
+    "enemies": "update",
+    "animation": "update",
+    "collision": "update",
+    "popups": "update",
+}
+TOP_PHASES = tuple(name for name, parent in PHASES.items() if parent is None)
+
+_NULL_PHASE = nullcontext()
+
+
+class _Phase:
+    """Reusable timing context for one phase, adds to the current frame's slot."""
+    __slots__ = ("_profiler", "_column", "_start")
+
+    def __init__(self, profiler, column):
+        self._profiler = profiler
+        self._column = column
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._column[self._profiler.slot] += time.perf_counter() - self._start
+        return False
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timings kept in a fixed-size ring buffer.
+    Frames longer than `budget` seconds are logged as hitches with the phase that caused them.
+    """
+
+    def __init__(self,
+                 enabled: bool = True,
+                 capacity: int = PROFILE_CAPACITY,
+                 budget: float = 1 / FRAMES
+                 ):
+        self.enabled = enabled
+        self.capacity = capacity
+        self.budget = budget
+        self.show_overlay = False
+
+        self.frame = 0          # frames recorded so far
+        self.slot = 0           # ring buffer index of the frame being recorded
+        self._frame_start = 0.0
+        self._totals = array("d", [0.0]) * capacity
+        self._columns = {name: array("d", [0.0]) * capacity for name in PHASES}
+        self._phases = {name: _Phase(self, column) for name, column in self._columns.items()}
+        self.hitches = deque(maxlen=PROFILE_HITCH_LOG)
+        self._sources = {}
+        self._counters = {}     # name -> (value(), per-frame column)
+        self._font = None
+
+    def add_source(self, name: str, stats):
+        """Include `stats()` (a JSON-friendly dict) under `name` in the summary and dump."""
+        self._sources[name] = stats
+
+    def add_counter(self, name: str, value):
+        """Record `value()` for every frame, e.g. sprites drawn; written as a CSV column."""
+        self._counters[name] = (value, array("d", [0.0]) * self.capacity)
+
+    # Recording
+    # ------------------------------------------------------------------
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.slot = self.frame % self.capacity
+        for column in self._columns.values():
+            column[self.slot] = 0.0
+        self._frame_start = time.perf_counter()
+
+    def phase(self, name):
+        """Context manager timing `name` within the current frame."""
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._phases[name]
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self._frame_start
+        self._totals[self.slot] = total
+        for value, column in self._counters.values():
+            column[self.slot] = value()
+        if total > self.budget:
+            self.hitches.append((self.frame, total, self.blame(self.slot)))
+        self.frame += 1
+
+    def blame(self, slot) -> str:
+        """Slowest top-level phase of a frame, narrowed to its slowest child if it has any."""
+        worst = max(TOP_PHASES, key=lambda name: self._columns[name][slot])
+        children = [name for name, parent in PHASES.items() if parent == worst]
+        if children:
+            child = max(children, key=lambda name: self._columns[name][slot])
+            if self._columns[child][slot] > 0:
+                return f"{worst}>{child}"
+        return worst
+
+    # Queries
+    # ------------------------------------------------------------------
+    def _recorded_slots(self):
+        count = min(self.frame, self.capacity)
+        # oldest first
+        start = self.frame - count
+        return [(start + i) % self.capacity for i in range(count)]
+
+    def percentiles(self, points=(50, 95, 99), phase=None) -> dict:
+        """Frame (or phase) time percentiles in milliseconds over the buffered frames."""
+        column = self._totals if phase is None else self._columns[phase]
+        values = sorted(column[slot] for slot in self._recorded_slots())
+        if not values:
+            return {p: 0.0 for p in points}
+        return {p: values[min(len(values) - 1, int(len(values) * p / 100))] * 1000 for p in points}
+
+    def summary(self) -> dict:
+        return {
+            "frames": self.frame,
+            "budget_ms": self.budget * 1000,
+            "frame_ms": self.percentiles(),
+            "phases_ms": {name: self.percentiles(phase=name) for name in PHASES},
+            "hitches": len(self.hitches),
+            "counters": {name: self._counter_summary(column) for name, (_, column) in self._counters.items()},
+            **{name: stats() for name, stats in self._sources.items()},
+        }
+
+    def _counter_summary(self, column) -> dict:
+        values = [column[slot] for slot in self._recorded_slots()]
+        if not values:
+            return {"mean": 0.0, "max": 0.0}
+        return {"mean": sum(values) / len(values), "max": max(values)}
+
+    # Output
+    # ------------------------------------------------------------------
+    def draw_overlay(self, surf):
+        """Draw the timing overlay in the top-right corner, returns the area it covered."""
+        if not (self.enabled and self.show_overlay):
+            return None
+        if self._font is None:
+            self._font = pygame.font.Font(None, PROFILE_FONT_SIZE)
+
+        p = self.percentiles()
+        lines = [f"frame p50 {p[50]:.1f}  p95 {p[95]:.1f}  p99 {p[99]:.1f} ms"]
+        for name in TOP_PHASES:
+            lines.append(f"{name:<14} p95 {self.percentiles(phase=name)[95]:.2f} ms")
+        if self.hitches:
+            frame, total, phase = self.hitches[-1]
+            lines.append(f"hitches {len(self.hitches)}  last #{frame} {total * 1000:.1f} ms in {phase}")
+
+        y = PROFILE_MARGIN
+        covered = None
+        for i, line in enumerate(lines):
+            color = RED if i == len(lines) - 1 and self.hitches else WHITE
+            text = self._font.render(line, True, color, BLACK)
+            drawn = surf.blit(text, (surf.get_width() - text.get_width() - PROFILE_MARGIN, y))
+            covered = drawn if covered is None else covered.union(drawn)
+            y += text.get_height()
+        return covered
+
+    def dump(self, path):
+        """Write the buffered frames to `path`.csv and a summary plus hitches to `path`.json."""
+        path = Path(path)
+        slots = self._recorded_slots()
+        first = self.frame - len(slots)
+
+        with open(path.with_suffix(".csv"), "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "total_ms", *PHASES, *self._counters])
+            for i, slot in enumerate(slots):
+                writer.writerow([first + i,
+                                 round(self._totals[slot] * 1000, 4),
+                                 *(round(self._columns[name][slot] * 1000, 4) for name in PHASES),
+                                 *(column[slot] for _, column in self._counters.values())])
+
+        report = self.summary()
+        report["hitch_log"] = [
+            {"frame": frame, "total_ms": total * 1000, "phase": phase}
+            for frame, total, phase in self.hitches
+        ]
+        with open(path.with_suffix(".json"), "w") as f:
+            json.dump(report, f, indent=2)
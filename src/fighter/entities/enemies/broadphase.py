@@ -0,0 +1,56 @@
+from bisect import bisect_left, bisect_right
+
+
+class SweepAndPrune:
+    """
+    Broadphase for the player-vs-enemies test. Enemies only move along x, so keeping them
+    sorted by left edge is enough: a query bisects to the few whose x-span can reach the
+    rect and runs the exact colliderect on those alone.
+    Rebuilt once per tick after movement; counts candidates tested against actual hits.
+    """
+
+    def __init__(self):
+        self._lefts = []
+        self._enemies = []
+        self._max_width = 0
+
+        self.queries = 0
+        self.candidates = 0
+        self.hits = 0
+        self.last_candidates = 0
+        self.last_hits = 0
+        self.last_population = 0
+
+    def rebuild(self, enemies):
+        ordered = sorted(enemies, key=lambda e: e.enemy_rect.left)
+        self._enemies = ordered
+        self._lefts = [e.enemy_rect.left for e in ordered]
+        self._max_width = max((e.enemy_rect.width for e in ordered), default=0)
+
+    def query(self, rect) -> list:
+        """Enemies whose rect overlaps `rect`."""
+        # right edge past rect.left needs left > rect.left - width, and left < rect.right
+        lo = bisect_right(self._lefts, rect.left - self._max_width)
+        hi = bisect_left(self._lefts, rect.right)
+        hits = [e for e in self._enemies[lo:hi] if e.alive and rect.colliderect(e.enemy_rect)]
+        self.record(len(self._enemies), hi - lo, len(hits))
+        return hits
+
+    def record(self, population, candidates, hits):
+        self.queries += 1
+        self.candidates += candidates
+        self.hits += hits
+        self.last_population = population
+        self.last_candidates = candidates
+        self.last_hits = hits
+
+    def stats(self) -> dict:
+        return {
+            "queries": self.queries,
+            "candidates": self.candidates,
+            "hits": self.hits,
+            # what a linear scan would have tested in the last query
+            "last_population": self.last_population,
+            "last_candidates": self.last_candidates,
+            "last_hits": self.last_hits,
+        }
@@ -1,28 +1,89 @@
 from abc import ABC, abstractmethod
-from src.fighter.core.constants import ENEMY_DEFAULT_SCORE
+from dataclasses import dataclass
+from typing import Optional
+
+import pygame
+from src.fighter.core.constants import ENEMY_DEFAULT_SCORE, ENEMY_DORMANT_MARGIN
+from src.fighter.assets.assets_path_enum import SoundKey
+
+
+@dataclass(slots=True)
+class EnemyPrototype:
+    """What every spawn of one enemy type shares, prepared once by EnemyManager."""
+    frames: list                # Frames to cycle through, a single one for static enemies
+    rect: pygame.Rect           # collision rect template, copied per instance
+    spawn_sfx: Optional[SoundKey] = None
+    offset: tuple = (0, 0)      # image position relative to the collision position
+    y: int = 0                  # line the type walks on
+
+    def dormant_x(self, width: int) -> int:
+        """x beyond which no frame of this type reaches into a `width` wide view."""
+        draw_left = min(f.offset[0] for f in self.frames) - self.offset[0]
+        return width - draw_left + ENEMY_DORMANT_MARGIN
 
 
 class Enemy(ABC):
     score_value = ENEMY_DEFAULT_SCORE
 
-    def __init__(self, x, y, velocity, game):
+    def __init__(self, x, y, velocity, game, prototype: EnemyPrototype, animator):
+        self.assets = game.assets
+        self.game = game
+        self.prototype = prototype
+        self.animator = animator
+        # owned for the instance's lifetime, moved in place
+        self.rect = prototype.rect.copy()
+        self.reset(x, y, velocity)
+
+    def reset(self, x, y, velocity):
+        """(Re)spawn: called from __init__ and when EnemyManager reuses a pooled instance."""
         self.x = x
         self.y = y
+        # x at the previous simulation step, used to interpolate draws
+        self.prev_x = x
         self.velocity = velocity
         self.alive = True
-        self.assets = game.assets
-        self.game = game
+        self.dormant = False
 
+    @classmethod
     @abstractmethod
-    def update(self):
-        """Advance position, animation, and rect."""
+    def build_prototype(cls, game) -> EnemyPrototype:
+        """Load and prepare this type's surfaces, rect template and sounds."""
         pass
 
     @abstractmethod
-    def draw(self, win):
-        """Blit current frame to win."""
+    def update(self, dt):
+        """Advance position, animation, and rect by one step of dt seconds."""
         pass
 
+    @abstractmethod
+    def draw(self, queue, alpha=1.0):
+        """Submit the current frame to the render queue, interpolated `alpha` of the way into the next step."""
+        pass
+
+    def park(self):
+        """Called when the instance goes (back) to its pool: stop anything that runs without update."""
+        pass
+
+    def update_dormant(self, dt):
+        """Cheap step while far off-screen: integrate position only, nothing to animate or cull."""
+        self.prev_x = self.x
+        self.x -= self.velocity
+        self.rect.x = self.x
+
+    def frame_index(self) -> int:
+        """Index into prototype.frames of the frame on screen."""
+        return 0
+
+    def collision_mask(self):
+        """Mask of the frame on screen and its top-left, placed the way draw places the frame."""
+        frame = self.prototype.frames[self.frame_index()]
+        offset = self.prototype.offset
+        return self.assets.get_mask(frame.surface), (self.x - offset[0] + frame.offset[0],
+                                                      self.y - offset[1] + frame.offset[1])
+
+    def render_x(self, alpha):
+        return self.prev_x + (self.x - self.prev_x) * alpha
+
     @abstractmethod
     def is_alive(self) -> bool:
         return self.alive
@@ -0,0 +1,243 @@
+import random
+
+import numpy as np
+from . import ENEMY_REGISTRY
+from .broadphase import SweepAndPrune
+from .narrowphase import MaskNarrowphase
+from src.fighter.core.constants import *
+from src.fighter.core.enums import RenderLayer
+from src.fighter.assets.assets_path_enum import SoundKey
+from logger import MyLogger
+
+logger = MyLogger().channel("enemies")
+
+# array fields of the enemy store, one slot per enemy
+_FIELDS = {
+    "x": np.int32,
+    "prev_x": np.int32,
+    "velocity": np.int32,
+    "type": np.int8,
+    "frame": np.int16,
+    "elapsed": np.float32,      # simulated milliseconds since the last frame advance
+    "alive": np.bool_,
+}
+
+
+class ArraySweepAndPrune(SweepAndPrune):
+    """SweepAndPrune over the horde's arrays: slots sorted by x, searched with searchsorted."""
+
+    def __init__(self):
+        super().__init__()
+        self._order = np.zeros(0, dtype=np.intp)
+        self._sorted_x = np.zeros(0, dtype=np.int32)
+
+    def rebuild(self, x, max_width):
+        # enemies keep roughly the same order between ticks, which suits a stable sort
+        self._order = np.argsort(x, kind="stable")
+        self._sorted_x = x[self._order]
+        self._max_width = max_width
+
+    def candidates_for(self, rect):
+        """Slots whose x-span may overlap `rect`."""
+        lo = np.searchsorted(self._sorted_x, rect.left - self._max_width, side="right")
+        hi = np.searchsorted(self._sorted_x, rect.right, side="left")
+        return self._order[lo:hi]
+
+
+class EnemyHorde:
+    """
+    Struct-of-arrays enemy store for horde mode, a drop-in for EnemyManager.
+    Enemies are slots in parallel NumPy arrays rather than objects; movement, culling and
+    animation run as batch operations and each enemy type goes to the render queue as one batch.
+    Per-type data (frames, rect size, walk line, score) comes from the registry's prototypes.
+    """
+
+    def __init__(self, game, wave_size: int = HORDE_WAVE):
+        self.game = game
+        self.assets = game.assets
+        self.wave_size = wave_size
+        self.killed_count = 0
+        self.waves = 0
+        self.rng = np.random.default_rng(random.getrandbits(32))
+
+        self.types = list(ENEMY_REGISTRY)
+        self.prototypes = [cls.build_prototype(game) for cls in self.types]
+        self.type_w = np.array([p.rect.width for p in self.prototypes], dtype=np.int32)
+        self.type_h = np.array([p.rect.height for p in self.prototypes], dtype=np.int32)
+        self.type_y = np.array([p.y for p in self.prototypes], dtype=np.int32)
+        self.type_score = np.array([cls.score_value for cls in self.types], dtype=np.int32)
+        self.type_frames = np.array([len(p.frames) for p in self.prototypes], dtype=np.int16)
+        # per type: surfaces and their draw offsets (prototype offset folded in), indexed by frame
+        self._surfaces = [[f.surface for f in p.frames] for p in self.prototypes]
+        self._dx = [np.array([f.offset[0] - p.offset[0] for f in p.frames], dtype=np.int32) for p in self.prototypes]
+        self._dy = [np.array([f.offset[1] - p.offset[1] for f in p.frames], dtype=np.int32) + p.y
+                    for p in self.prototypes]
+        self._masks = [game.assets.get_masks(p.frames) for p in self.prototypes]
+        self._fw = [np.array([f.surface.get_width() for f in p.frames], dtype=np.int32) for p in self.prototypes]
+        self._fh = [np.array([f.surface.get_height() for f in p.frames], dtype=np.int32) for p in self.prototypes]
+        # past its type's x nothing of an enemy can be on screen: no animation
+        self.type_dormant_x = np.array([p.dormant_x(game.WIDTH) for p in self.prototypes], dtype=np.int32)
+
+        self.broadphase = ArraySweepAndPrune()
+        self.narrowphase = MaskNarrowphase()
+        self._max_width = int(self.type_w.max())
+
+        self.count = 0              # live slots are [0, count)
+        self._allocate(wave_size)
+        logger.info("EnemyHorde initialized for level %d, waves of %d", self.game.level, wave_size)
+
+    def _allocate(self, capacity):
+        for name, dtype in _FIELDS.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def spawn_wave(self, level: int):
+        n = self.wave_size
+        if self.count + n > self.capacity:
+            self._allocate(max(self.count + n, self.capacity * 2))
+        new = slice(self.count, self.count + n)
+
+        width = self.game.WIDTH
+        x = self.rng.integers(width + ENEMY_OFFSET_RANDOM, width + ENEMY_OFFSCREEN + n * HORDE_SPACING, n,
+                              endpoint=True)
+        self.x[new] = x
+        self.prev_x[new] = x
+        self.velocity[new] = self.rng.integers(ENEMY_BASE_VELOCITY,
+                                               min(ENEMY_MINIMUM_VELOCITY + level, ENEMY_MAXIMUM_VELOCITY),
+                                               n,
+                                               endpoint=True)
+        types = self.rng.integers(0, len(self.types), n)
+        self.type[new] = types
+        self.frame[new] = 0
+        self.elapsed[new] = 0.0
+        self.alive[new] = True
+        self.count += n
+        self.waves += 1
+
+        # one spawn sound per type and wave, not per enemy
+        for t in np.unique(types):
+            sfx = self.prototypes[t].spawn_sfx
+            if sfx:
+                self.game.audio.play_sfx(sfx)
+        logger.info("Spawned a horde wave of %d enemies for level %d", n, level)
+
+    def spawn_step(self):
+        # one vectorised wave, nothing to spread over frames
+        if not self.count:
+            self.spawn_wave(self.game.level)
+
+    def spawn_stats(self) -> dict:
+        return {"waves": self.waves, "spawned": self.waves * self.wave_size}
+
+    def update(self, dt):
+        n = self.count
+        x, t = self.x[:n], self.type[:n]
+
+        # move
+        self.prev_x[:n] = x
+        x -= self.velocity[:n]
+
+        # animate what could be visible, static types wrap straight back to frame 0
+        awake = x <= self.type_dormant_x[t]
+        elapsed = self.elapsed[:n]
+        elapsed[awake] += dt * 1000
+        due = elapsed > FRAME_DURATION
+        elapsed[due] = 0.0
+        frame = self.frame[:n]
+        frame[due] = (frame[due] + 1) % self.type_frames[t[due]]
+
+        # off the left edge
+        self.alive[:n] &= x + self.type_w[t] >= 0
+
+        self._compact()
+        self.broadphase.rebuild(self.x[:self.count], self._max_width)
+
+    def pool_stats(self) -> dict:
+        # the arrays are the pool: slots are reused and only grow with the largest horde
+        return {"horde": {"size": self.capacity, "in_use": self.count}}
+
+    def resolve_collisions(self, player, spawn_popup) -> bool:
+        """Same contract as EnemyManager.resolve_collisions, the rect test vectorised over the candidates."""
+        rect = player.player_rect
+        candidates = self.broadphase.candidates_for(rect)
+        hits = candidates[self._overlaps(rect, self.x[candidates], self.type[candidates])]
+        self.broadphase.record(self.count, len(candidates), len(hits))
+        if len(hits):
+            hits = np.array(self.narrowphase.confirm(*player.collision_mask(), self._mask_candidates(hits)),
+                            dtype=np.intp)
+        if not player.attacking:
+            return len(hits) > 0
+
+        if len(hits):
+            self._handle_kills(hits, spawn_popup)
+            self.alive[hits] = False
+            self._compact()
+
+        if self.killed_count >= REQUIRED_KILL_LEVEL:
+            self.game.level += 1
+            self.killed_count = 0
+        return False
+
+    def _overlaps(self, rect, x, t):
+        """Rect.colliderect against every slot, vectorised."""
+        y = self.type_y[t]
+        return ((x < rect.right) & (x + self.type_w[t] > rect.left) &
+                (y < rect.bottom) & (y + self.type_h[t] > rect.top))
+
+    def _mask_candidates(self, slots):
+        """(slot, mask, top-left) of each slot's frame on screen, placed as in draw."""
+        for slot in slots.tolist():
+            t, f = self.type[slot], self.frame[slot]
+            yield slot, self._masks[t][f], (int(self.x[slot] + self._dx[t][f]), int(self._dy[t][f]))
+
+    def _handle_kills(self, slots, spawn_popup):
+        for slot in slots.tolist():
+            t = self.type[slot]
+            spawn_popup(f"+{self.type_score[t]}", (int(self.x[slot]) + int(self.type_w[t]) // 2, int(self.type_y[t])))
+        self.game.score += int(self.type_score[self.type[slots]].sum())
+        self.killed_count += len(slots)
+        self.game.audio.play_sfx(SoundKey.COIN)
+
+    def _compact(self):
+        """Move live enemies to the front so every batch operation stays dense."""
+        n = self.count
+        keep = self.alive[:n]
+        live = int(keep.sum())
+        if live == n:
+            return
+        for name in _FIELDS:
+            column = getattr(self, name)
+            column[:live] = column[:n][keep]
+        self.count = live
+
+    def draw(self, queue, alpha=1.0):
+        n = self.count
+        if not n:
+            return
+        t = self.type[:n]
+        render_x = (self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha).astype(np.int32)
+        view = queue.viewport
+        drawn = 0
+        for i, surfaces in enumerate(self._surfaces):
+            mine = t == i
+            if not mine.any():
+                continue
+            frames = self.frame[:n][mine]
+            xs = render_x[mine] + self._dx[i][frames]
+            ys = self._dy[i][frames]
+            # viewport culling, the same test RenderQueue.submit does per sprite
+            visible = ((xs < view.right) & (xs + self._fw[i][frames] > view.left) &
+                       (ys < view.bottom) & (ys + self._fh[i][frames] > view.top))
+            drawn += int(visible.sum())
+            queue.extend(RenderLayer.ENEMIES, [(surfaces[f], (fx, fy)) for f, fx, fy in
+                                               zip(frames[visible].tolist(), xs[visible].tolist(), ys[visible].tolist())])
+        queue.note_culled(n - drawn)
+        # too many sprites to track one by one
+        self.game.compositor.invalidate()
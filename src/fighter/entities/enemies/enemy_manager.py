@@ -1,98 +1,136 @@
-import random
 from . import ENEMY_REGISTRY
+from .broadphase import SweepAndPrune
+from .narrowphase import MaskNarrowphase
+from .spawn_scheduler import SpawnScheduler, SpawnOrder
 from src.fighter.core.constants import *
 from src.fighter.core.enums import GameStateNum
+from src.fighter.core.pool import Pool
 from src.fighter.assets.assets_path_enum import SoundKey
-from src.graphics.score_popup import ScorePopup
-import pygame
 from logger import MyLogger
 
-logger = MyLogger()
+logger = MyLogger().channel("enemies")
 
 
 class EnemyManager:
-    def __init__(self, game):
+    def __init__(self, game, animator):
         self.game = game
+        self.animator = animator
         self.assets = game.assets
         self.ground = GROUND
         self.killed_count = 0
         self.enemies = []
 
-        logger.info(f"EnemyManager initialized for level {self.game.level}")
-        self.enemies = self.create_random_enemies(level=self.game.level)
+        # per-type surfaces, rects and sounds, prepared once instead of on every spawn
+        self.prototypes = {cls: cls.build_prototype(game) for cls in ENEMY_REGISTRY}
+        self.broadphase = SweepAndPrune()
+        self.narrowphase = MaskNarrowphase()
+        for prototype in self.prototypes.values():
+            self.assets.get_masks(prototype.frames)
+        # enemies are reused across waves instead of rebuilt per spawn
+        self.pools = {cls: Pool(cls.__name__, self._factory(cls)) for cls in ENEMY_REGISTRY}
 
-    def update_and_handle_kills(self, player, popup_list, popup_font):
-        """
-        1) Move enemies, detect kills
-        2) For each kill: spawn a ScorePopup, play sound, increment score
-        3) Cull dead enemies
-        4) Return nothing (all side-effects internalized)
-        """
-        # Spawn wave if needed
-        if not self.enemies:
-            self.enemies = self.create_random_enemies(self.game.level)
+        # past its type's x an enemy cannot be on screen, it gets the position-only update
+        self.dormant_x = {cls: p.dormant_x(self.game.WIDTH) for cls, p in self.prototypes.items()}
+        self.dormant = 0
+
+        # waves are planned ahead and handed out over frames, the first one on the first spawn_step
+        self.scheduler = SpawnScheduler(self)
+
+        logger.info("EnemyManager initialized for level %d", self.game.level)
 
-        # Move & detect kill events
+    def _factory(self, cls):
+        prototype = self.prototypes[cls]
+        return lambda x, y, velocity: cls(x, y, velocity, self.game, prototype, self.animator)
+
+    def _cull(self):
+        """Drop dead enemies from the live list and hand them back to their pools."""
+        live = []
+        for e in self.enemies:
+            if e.alive:
+                live.append(e)
+            else:
+                self.pools[type(e)].release(e)
+        self.enemies = live
+
+    def pool_stats(self) -> dict:
+        return {pool.name: pool.stats() for pool in self.pools.values()}
+
+    def spawn_step(self):
+        """Hand out this frame's share of the current wave, starting the next one when it is cleared."""
+        self.enemies.extend(self.scheduler.step(self.game.level, wave_cleared=not self.enemies))
+
+    def spawn_stats(self) -> dict:
+        return self.scheduler.stats()
+
+    def spawn(self, order: SpawnOrder):
+        enemy = self.pools[order.cls].acquire(order.x, order.y, order.velocity)
+        sfx = self.prototypes[order.cls].spawn_sfx
+        if sfx:
+            self.game.audio.play_sfx(sfx)
+        logger.debug("Spawned %s at (%d, %d) with velocity %d", order.cls.__name__, order.x, order.y, order.velocity)
+        return enemy
+
+    def update(self, dt):
+        """Move enemies, cull the ones that left and re-sort the broadphase."""
+        dormant_x = self.dormant_x
+        dormant = 0
         for e in self.enemies:
             if e.alive:
-                e.update()
-                if player.attacking and player.check_collision_with_enemy(e.enemy_rect):
-                    e.alive = False
+                e.dormant = e.x > dormant_x[e.__class__]
+                if e.dormant:
+                    e.update_dormant(dt)
+                    dormant += 1
+                else:
+                    e.update(dt)
+        self.dormant = dormant
+
+        self._cull()
+        self.broadphase.rebuild(self.enemies)
+
+    def resolve_collisions(self, player, spawn_popup) -> bool:
+        """
+        One broadphase query for the player rect, confirmed pixel by pixel with the frame
+        masks, answers both questions:
+        when attacking, the overlapping enemies are killed (popup via `spawn_popup(text, pos)`,
+        sound, score); otherwise any overlap is contact. Returns whether the player was hit.
+        """
+        overlapping = self.broadphase.query(player.player_rect)
+        if overlapping:
+            # the rects are the early-out, masks only for the pairs they let through
+            overlapping = self.narrowphase.confirm(*player.collision_mask(),
+                                                   [(e, *e.collision_mask()) for e in overlapping])
+        if not player.attacking:
+            return bool(overlapping)
 
-                    self.play_kill_sfx()
+        for e in overlapping:
+            e.alive = False
+            self.play_kill_sfx()
 
-                    # spawn score popup
-                    popup_list.append(ScorePopup(f"+{e.score_value}", (e.enemy_rect.centerx, e.enemy_rect.top), popup_font))
+            # spawn score popup
+            spawn_popup(f"+{e.score_value}", (e.enemy_rect.centerx, e.enemy_rect.top))
 
-                    self.game.score += e.score_value
-                    self.killed_count += 1
+            self.game.score += e.score_value
+            self.killed_count += 1
 
-        # Remove dead enemies
-        self.enemies = [e for e in self.enemies if e.alive]
+        if overlapping:
+            self._cull()
 
         # Level up
         if self.killed_count >= REQUIRED_KILL_LEVEL:
             self.game.level += 1
             self.killed_count = 0
+        return False
 
     def play_kill_sfx(self):
         """
-        Look for free channel to play sound
+        Play the kill sound; the mixer steals a voice from a lower priority sound if needed
         :return:
         """
-        ch = pygame.mixer.find_channel()
-        if ch:
-            self.game.audio.play_sfx(SoundKey.COIN)
-        else:
-            pygame.mixer.Channel(0).play(self.game.assets.get_sound(SoundKey.COIN))
-
-    def draw(self, win):
-        logger.debug(f"Drawing {len(self.enemies)} enemies")
-        for enemy in self.enemies:
-            if enemy.is_alive():  # Only draw alive enemies
-                enemy.draw(win)
-
-    def create_random_enemies(self, level: int):
-        enemies = []
-        enemy_count = min(2 + level, 8)
-
-        logger.info(f"Creating {enemy_count} enemies for level {level}")
-        logger.debug(f"registry is: {ENEMY_REGISTRY} before entering enemy creation loop")
+        self.game.audio.play_sfx(SoundKey.COIN)
 
-        for _ in range(enemy_count):
-            enemy_x = random.randint(self.game.WIDTH + ENEMY_OFFSET_RANDOM, self.game.WIDTH + ENEMY_OFFSCREEN)
-            enemy_y = self.ground
-
-            velocity = random.randint(ENEMY_BASE_VELOCITY, min(ENEMY_MINIMUM_VELOCITY + level, ENEMY_MAXIMUM_VELOCITY))
-            enemy_class = random.choice(ENEMY_REGISTRY)
-
-            logger.debug(f"Created {enemy_class.__name__} at ({enemy_x}, {enemy_y}) with velocity {velocity}")
-
-            enemies.append(enemy_class(enemy_x,
-                                       enemy_y,
-                                       velocity,
-                                       self.game)
-                           )
-            logger.info(f"Enemy {enemy_class.__name__} created")
-            logger.info(f"Successfully created {len(enemies)} enemies")
-        return enemies
+    def draw(self, queue, alpha=1.0):
+        # only live enemies are left in the list after culling, dormant ones are out of view
+        for enemy in self.enemies:
+            if not enemy.dormant:
+                enemy.draw(queue, alpha)
+        queue.note_culled(self.dormant)
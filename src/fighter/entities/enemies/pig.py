@@ -1,54 +1,65 @@
 from . import register_enemy
-from .enemy_base import Enemy
+from .enemy_base import Enemy, EnemyPrototype
 from src.fighter.assets.assets_path_enum import EntityImageKey
+from src.fighter.assets.sprite_loader import Frame
 import pygame
 from src.fighter.core.constants import *
+from src.fighter.core.enums import RenderLayer
 from logger import MyLogger
 
-logger = MyLogger()
+logger = MyLogger().channel("enemies")
 
 
 @register_enemy
 class Pig(Enemy):
     score_value = PIG_SCORE
 
-    def __init__(self, x, y, velocity, game):
-        super().__init__(x, y, velocity, game)
+    @classmethod
+    def build_prototype(cls, game) -> EnemyPrototype:
         # pig only has a single image
-        self.image = self.game.assets.get_image(EntityImageKey.PIG)
-        self.image = pygame.transform.scale(self.image, PIG_SIZE)
+        image = pygame.transform.scale(game.assets.get_image(EntityImageKey.PIG), PIG_SIZE)
+        return EnemyPrototype(frames=[Frame(image, (0, 0))],
+                              rect=pygame.Rect(0, 0, PIG_RECT_W, PIG_RECT_H),
+                              offset=tuple(PIG_OFFSET),
+                              y=PIG_Y
+                              )
+
+    def __init__(self, x, y, velocity, game, prototype, animator):
+        self.image = prototype.frames[0].surface
+        super().__init__(x, y, velocity, game, prototype, animator)
+
+    def reset(self, x, y, velocity):
+        super().reset(x, y, velocity)
         # Update coordinates to match rect
         self.x = PIG_X
         self.y = PIG_Y
+        self.prev_x = self.x
+        self._update_rect()
 
-        # initialize piggy rect
-        self.rect = pygame.Rect(self.x, self.y, PIG_SIZE[0], PIG_SIZE[1])
-
-    def update(self):
+    def update(self, dt):
         # move left
+        self.prev_x = self.x
         self.x -= self.velocity
 
-        # update rect's position using middle of the bottom side of the rectangle
-        self.rect.midbottom = (self.x, self.y)
-
         self._update_rect()
 
         # if off-screen, mark dead
         if self.x + self.rect.width < 0:
             self.alive = False
-            logger.debug(f"Pig marked dead - off screen at x: {self.x}")
+            logger.debug("Pig marked dead - off screen at x: %d", self.x)
 
-    def draw(self, win):
+    def draw(self, queue, alpha=1.0):
         # adjust the pig's rect position to match the image
-        win.blit(self.image, (self.x - PIG_OFFSET[0], self.y - PIG_OFFSET[1]))
+        queue.submit(self.image, (self.render_x(alpha) - PIG_OFFSET[0], self.y - PIG_OFFSET[1]), RenderLayer.ENEMIES)
         if DEBUG:
-            pygame.draw.rect(win, (255, 0, 0), self.rect, 1)
+            queue.outline(self.rect, (255, 0, 0), 1)
 
     def is_alive(self):
         return self.alive
 
     def _update_rect(self):
-        self.rect = pygame.Rect(self.x, self.y, PIG_RECT_W, PIG_RECT_H)
+        # in place, the rect keeps the prototype's size
+        self.rect.topleft = (self.x, self.y)
 
     @property
     def enemy_rect(self):
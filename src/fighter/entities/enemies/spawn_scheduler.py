@@ -0,0 +1,107 @@
+import random
+import time
+from collections import deque
+from typing import NamedTuple
+
+from . import ENEMY_REGISTRY
+from src.fighter.core.constants import *
+from logger import MyLogger
+
+logger = MyLogger().channel("enemies")
+
+
+class SpawnOrder(NamedTuple):
+    cls: type
+    x: int
+    y: int
+    velocity: int
+
+
+class SpawnScheduler:
+    """
+    Plans the next wave while the current one is still on screen, then hands it out
+    `per_tick` enemies per simulation step, so spawns never depend on how fast the machine is.
+    Building the pooled enemies the wave will need is the costly part; that runs on quiet
+    frames within `budget` seconds per frame.
+    """
+
+    def __init__(self, manager, per_tick: int = SPAWN_PER_TICK, budget: float = SPAWN_FRAME_BUDGET):
+        self.manager = manager
+        self.per_tick = per_tick
+        self.budget = budget
+        self._queue = deque()       # orders of the wave being handed out
+        self._planned = None        # (level, orders) of the next wave
+        self._reserve = deque()     # (cls, free count) still to build for the next wave
+
+        self.waves = 0
+        self.spawned = 0
+        self.last_ms = 0.0          # spawn time of the most recent frame
+        self.max_ms = 0.0
+        self.spread_frames = 0      # frames the last wave was handed out over
+
+    def plan(self, level: int) -> list:
+        game = self.manager.game
+        orders = []
+        for _ in range(min(2 + level, 8)):
+            orders.append(SpawnOrder(random.choice(ENEMY_REGISTRY),
+                                     random.randint(game.WIDTH + ENEMY_OFFSET_RANDOM, game.WIDTH + ENEMY_OFFSCREEN),
+                                     self.manager.ground,
+                                     random.randint(ENEMY_BASE_VELOCITY,
+                                                    min(ENEMY_MINIMUM_VELOCITY + level, ENEMY_MAXIMUM_VELOCITY))))
+        return orders
+
+    def _plan_ahead(self, level):
+        self._planned = (level, self.plan(level))
+        # a level up before the wave starts re-rolls it one size larger, and any wave
+        # may be all one type: reserve that worst case of every type
+        worst = min(2 + level + 1, 8)
+        self._reserve.extend((cls, count) for cls in ENEMY_REGISTRY for count in range(1, worst + 1))
+
+    def _build_reserve(self, deadline):
+        game = self.manager.game
+        while self._reserve and time.perf_counter() < deadline:
+            cls, count = self._reserve.popleft()
+            # placeholder spawn arguments, acquire resets the instance
+            self.manager.pools[cls].reserve(count, game.WIDTH, self.manager.ground, ENEMY_BASE_VELOCITY)
+
+    def step(self, level: int, wave_cleared: bool) -> list:
+        """Enemies to add this frame. Starts the next wave once the previous one is cleared."""
+        start = time.perf_counter()
+        spawned = []
+        if wave_cleared and not self._queue:
+            planned_level, orders = self._planned or (None, None)
+            # the level can go up between planning and the wave starting
+            if planned_level != level:
+                orders = self.plan(level)
+            self._planned = None
+            self._reserve.clear()
+            self._queue.extend(orders)
+            self.waves += 1
+            self.spread_frames = 0
+            logger.info("Spawning %d enemies for level %d", len(orders), level)
+
+        if self._queue:
+            self.spread_frames += 1
+            for _ in range(min(self.per_tick, len(self._queue))):
+                spawned.append(self.manager.spawn(self._queue.popleft()))
+            self.spawned += len(spawned)
+        else:
+            # quiet frame: roll the next wave, then build what the pools may be missing
+            if self._planned is None:
+                self._plan_ahead(level)
+            self._build_reserve(start + self.budget)
+
+        self.last_ms = (time.perf_counter() - start) * 1000
+        self.max_ms = max(self.max_ms, self.last_ms)
+        return spawned
+
+    def stats(self) -> dict:
+        return {
+            "waves": self.waves,
+            "spawned": self.spawned,
+            "pending": len(self._queue),
+            "reserve_pending": len(self._reserve),
+            "last_ms": self.last_ms,
+            "max_ms": self.max_ms,
+            "spread_frames": self.spread_frames,
+        }
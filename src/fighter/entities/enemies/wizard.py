@@ -1,70 +1,89 @@
 import pygame
 from . import register_enemy, ENEMY_REGISTRY
-from .enemy_base import Enemy
+from .enemy_base import Enemy, EnemyPrototype
 from ...core.constants import *
+from ...core.enums import FighterActionNUM, RenderLayer
 from src.fighter.assets.assets_path_enum import EntityImageKey, SoundKey
 
 from logger import MyLogger
 
-logger = MyLogger()
+logger = MyLogger().channel("enemies")
 
 
 @register_enemy
 class Wizard(Enemy):
-    def __init__(self, x, y, velocity, game):
-        super().__init__(x, y, velocity, game)
-
-        # Run
-        self.current_action = 1
-
-        self.animations = self.assets.get_animation(EntityImageKey.WIZARD,
-                                                    WIZARD_SIZE,
-                                                    WIZARD_SCALE,
-                                                    WIZARD_PER_ACTION
-                                                    )
+    @classmethod
+    def build_prototype(cls, game) -> EnemyPrototype:
+        animations = game.assets.get_animation(EntityImageKey.WIZARD,
+                                               WIZARD_SIZE,
+                                               WIZARD_SCALE,
+                                               WIZARD_PER_ACTION
+                                               )
+        game.audio.prepare_sfx(SoundKey.EVIL)
+        # Run; the sheet faces right, wizards walk left
+        return EnemyPrototype(frames=animations.frames(FighterActionNUM.RUN, facing_right=False),
+                              rect=pygame.Rect(0, 0, WIZARD_RECT_W, WIZARD_RECT_H),
+                              spawn_sfx=SoundKey.EVIL,
+                              offset=tuple(WIZARD_OFFSET),
+                              y=WIZARD_Y
+                              )
+
+    def __init__(self, x, y, velocity, game, prototype, animator):
+        self.current_animation = prototype.frames
+        # one animator slot for the instance's lifetime, pooled reuse restarts it
+        self.anim = animator.add(FighterActionNUM.RUN, len(prototype.frames))
+        super().__init__(x, y, velocity, game, prototype, animator)
+
+    def reset(self, x, y, velocity):
+        super().reset(x, y, velocity)
         self.x = WIZARD_X
         self.y = WIZARD_Y
+        self.prev_x = self.x
 
-        self.current_frame = 0
-        self.last_update = pygame.time.get_ticks()
-
-        self.current_animation = self.animations[self.current_action]
-
-        self.rect = pygame.Rect(self.x, self.y, WIZARD_RECT_W, WIZARD_RECT_H)
-        self.game.audio.play_sfx(SoundKey.EVIL)
+        self.animator.restart(self.anim)
+        self.animator.pause(self.anim, False)
 
-        logger.info(f"Wizard created at ({x}, {y}) with velocity {velocity}")
+        self._update_rect()
 
     def is_alive(self):
         return self.alive
 
-    def draw(self, win):
-        surf = self.current_animation[self.current_frame]
-        frame = pygame.transform.flip(surf, True, False)
+    def frame_index(self) -> int:
+        return self.animator.frame[self.anim]
+
+    def draw(self, queue, alpha=1.0):
+        frame = self.current_animation[self.animator.frame[self.anim]]
 
-        win.blit(frame, (self.x - WIZARD_OFFSET[0], self.y - WIZARD_OFFSET[1]))
+        queue.submit(frame.surface, (self.render_x(alpha) - WIZARD_OFFSET[0] + frame.offset[0],
+                                     self.y - WIZARD_OFFSET[1] + frame.offset[1]), RenderLayer.ENEMIES)
 
         if DEBUG:
-            pygame.draw.rect(win, (255, 0, 0), self.rect, 1)
+            queue.outline(self.rect, (255, 0, 0), 1)
+
+    def park(self):
+        # the Animator steps every unpaused slot, pooled wizards included
+        self.animator.pause(self.anim)
+
+    def update_dormant(self, dt):
+        super().update_dormant(dt)
+        self.animator.pause(self.anim)
 
-    def update(self):
+    def update(self, dt):
+        self.animator.pause(self.anim, False)
         # move left
+        self.prev_x = self.x
         self.x -= self.velocity
-        # animate
-        now = pygame.time.get_ticks()
-        if now - self.last_update > FRAME_DURATION:
-            self.last_update = now
-            self.current_frame = (self.current_frame + 1) % len(self.animations[self.current_action])
 
         self._update_rect()
 
         if self.x + self.rect.width < 0:
             self.alive = False
 
-            logger.debug(f"Wizard marked dead - off screen at x: {self.x}")
+            logger.debug("Wizard marked dead - off screen at x: %d", self.x)
 
     def _update_rect(self):
-        self.rect = pygame.Rect(self.x, self.y, WIZARD_RECT_W, WIZARD_RECT_H)
+        # in place, the rect keeps the prototype's size
+        self.rect.topleft = (self.x, self.y)
 
     @property
     def enemy_rect(self):
@@ -1,6 +1,6 @@
 import pygame
 from ..core.constants import *
-from ..core.enums import FighterActionNUM
+from ..core.enums import FighterActionNUM, RenderLayer
 from src.fighter.assets.assets_path_enum import *
 from src.fighter.states.states import *
 
@@ -10,15 +10,18 @@ logger = MyLogger()
 
 
 class Player:
-    def __init__(self, assets, game):
+    def __init__(self, assets, game, animator):
         self.game = game
         self.assets = assets
+        self.animator = animator
         self._initialize_state()
         self._load_animations()
         self._setup_physics()
 
     def _initialize_state(self):
         self.player_position = pygame.math.Vector2(PLAYER_X, PLAYER_Y)
+        # position at the previous simulation step, used to interpolate draws
+        self.prev_position = pygame.math.Vector2(self.player_position)
         self.rect_size = pygame.math.Vector2(PLAYER_RECT_W, PLAYER_RECT_H)
         self.facing_right = True
         self.velocity = pygame.math.Vector2(0, 0)
@@ -43,9 +46,20 @@ class Player:
                                                     PLAYER_PER_ACTION
                                                     )
 
+        # hits are pixel-exact against these, built now rather than on the first contact
+        self.assets.prepare_masks(self.animations)
+
         self.current_action = FighterActionNUM.IDLE
-        self.current_frame = 0
-        self.last_animation_update = pygame.time.get_ticks()
+        # frame and timing live in the shared Animator, advanced by Playing
+        self.anim = self.animator.add(self.current_action, len(self.animations[self.current_action]))
+
+    @property
+    def current_frame(self):
+        return self.animator.frame[self.anim]
+
+    @current_frame.setter
+    def current_frame(self, index):
+        self.animator.frame[self.anim] = index
 
     def _setup_physics(self):
         """Configure physics-related properties"""
@@ -85,14 +99,12 @@ class Player:
             self._perform_attack(SoundKey.SWORD)
             if self.attacking is None:
                 self.attacking = FighterActionNUM.ATK1
-                self.current_frame = 0
-                self.last_animation_update = pygame.time.get_ticks()
+                self.animator.restart(self.anim)
         elif keys[pygame.K_d]:
             self._perform_attack(SoundKey.SWORD)
             if self.attacking is None:
                 self.attacking = FighterActionNUM.ATK2
-                self.current_frame = 0
-                self.last_animation_update = pygame.time.get_ticks()
+                self.animator.restart(self.anim)
 
     def _get_current_frame(self):
         """Get properly oriented animation frame"""
@@ -105,9 +117,7 @@ class Player:
         if self.current_frame >= len(frames):
             self.current_frame = 0
 
-        frame = self.animations[self.current_action][self.current_frame]
-        surf = pygame.transform.flip(frame, not self.facing_right, False)
-        return surf
+        return self.animations.frame(self.current_action, self.current_frame, self.facing_right)
 
     def _apply_physics(self):
         """Apply physics calculations"""
@@ -126,8 +136,9 @@ class Player:
             self.velocity.y = 0
             self.jumping = False
 
-    def update(self):
-        """Update player state and physics"""
+    def update(self, dt):
+        """Update player state and physics by one simulation step of dt seconds"""
+        self.prev_position.update(self.player_position)
         self._apply_physics()
         self._update_action_state()
         self._update_animation()
@@ -159,11 +170,8 @@ class Player:
         self.current_action = FighterActionNUM.IDLE
 
     def _update_animation(self):
-        """Update animation frame based on state"""
-        now = pygame.time.get_ticks()
-        if now - self.last_animation_update > FRAME_DURATION:
-            self.last_animation_update = now
-            self.current_frame = (self.current_frame + 1) % len(self.animations[self.current_action])
+        """Point the animation at the current action's clip, the Animator advances it"""
+        self.animator.set_clip(self.anim, self.current_action, len(self.animations[self.current_action]))
 
     def _perform_attack(self, sound_key):
         """Execute attack logic"""
@@ -193,15 +201,26 @@ class Player:
                 self.player_position.y
             )
 
-    def draw(self):
-        player_screen = self._get_current_frame()
+    def draw(self, queue, alpha=1.0):
+        frame = self._get_current_frame()
+        pos = self.prev_position.lerp(self.player_position, alpha)
 
-        self.game.screen.blit(player_screen, (
-            self.player_position.x - (PLAYER_OFFSET[0] * PLAYER_SCALE),
-            self.player_position.y - (PLAYER_OFFSET[1] * PLAYER_SCALE)
-        ))
+        # PLAYER_OFFSET is the cell point that sits on player_position, frame.offset
+        # places the trimmed frame inside the cell
+        queue.submit(frame.surface, (
+            pos.x - (PLAYER_OFFSET[0] * PLAYER_SCALE) + frame.offset[0],
+            pos.y - (PLAYER_OFFSET[1] * PLAYER_SCALE) + frame.offset[1]
+        ), RenderLayer.PLAYER)
         if DEBUG:
-            pygame.draw.rect(self.game.screen, (0, 0, 0), self.player_rect, 2)
+            queue.outline(self.player_rect, (0, 0, 0), 2)
+
+    def collision_mask(self):
+        """Mask of the frame on screen and its top-left at the current position."""
+        frame = self._get_current_frame()
+        return self.assets.get_mask(frame.surface), (
+            int(self.player_position.x - PLAYER_OFFSET[0] * PLAYER_SCALE) + frame.offset[0],
+            int(self.player_position.y - PLAYER_OFFSET[1] * PLAYER_SCALE) + frame.offset[1]
+        )
 
     def is_alive(self):
         return self.alive
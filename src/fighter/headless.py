@@ -0,0 +1,192 @@
+import os
+
+# dummy drivers must be picked before pygame initialises SDL
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+import pygame
+from src.fighter.states.base import IGame
+from src.fighter.assets.assets_path_enum import InGameImageKey
+from src.fighter.assets.asset_manager import AssetManager
+from src.fighter.assets.audio_manager import AudioManager
+from src.fighter.core.constants import SIM_DT, HEADLESS_TICKS, LOG_LEVEL, LOG_SUBSYSTEM_LEVELS, LEVEL_FONT_SIZE
+from src.fighter.core.clock import FixedStepClock
+from src.fighter.core.profiler import FrameProfiler
+from src.graphics.compositor import Compositor
+from src.graphics.render_queue import RenderQueue
+from src.graphics.text_cache import TextCache
+from src.fighter.core.enums import GameStateNum
+from src.fighter.states.states import Playing
+from logger import MyLogger
+
+logger = MyLogger()
+
+
+# Input policies: called once per tick with the tick number, return a key state
+def idle_policy(tick):
+    return defaultdict(bool)
+
+
+def attack_policy(tick):
+    keys = defaultdict(bool)
+    keys[pygame.K_a] = True
+    return keys
+
+
+def random_policy(tick):
+    keys = defaultdict(bool)
+    for k in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_a, pygame.K_d):
+        keys[k] = random.random() < 0.3
+    return keys
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "attack": attack_policy,
+    "random": random_policy,
+}
+
+
+@dataclass(slots=True)
+class HeadlessResult:
+    ticks: int
+    seconds: float
+    deaths: int
+    best_score: int
+    best_level: int
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.seconds if self.seconds else 0.0
+
+
+class HeadlessGame(IGame):
+    """
+    Runs the Playing state without a window, audio or frame cap.
+    Each tick is one fixed simulation step; nothing is presented.
+    """
+
+    def __init__(self, seed=None, policy=idle_policy, profile=False, render=False, horde=0):
+        logger.configure(LOG_LEVEL, LOG_SUBSYSTEM_LEVELS)
+        pygame.display.init()
+        pygame.font.init()
+        if seed is not None:
+            random.seed(seed)
+
+        self.assets = AssetManager()
+        self.audio = AudioManager(self.assets, enabled=False)
+        self.states = {}
+        self.policy = policy
+        self.render = render
+        self.horde = horde
+
+        self.score = 0
+        self.level = 1
+
+        self.WIDTH, self.HEIGHT = self.assets.get_image(InGameImageKey.BACKGROUND).get_size()
+        # off-screen target, there is no display mode
+        self.screen = pygame.Surface((self.WIDTH, self.HEIGHT))
+        self.compositor = Compositor(self.screen)
+        self.render_queue = RenderQueue(self.screen, self.compositor)
+        self.hud_font = pygame.font.Font(None, LEVEL_FONT_SIZE)
+
+        self.sim_clock = FixedStepClock()
+        self.profiler = FrameProfiler(enabled=profile)
+        self.profiler.add_source("render", self.render_queue.stats)
+        self.profiler.add_counter("drawn", lambda: self.render_queue.sprites)
+        self.profiler.add_counter("culled", lambda: self.render_queue.culled)
+        self.profiler.add_source("masks", self.assets.mask_stats)
+        self.profiler.add_source("text_cache", TextCache().stats)
+        Playing.add_profiler_sources(self)
+        self.deaths = 0
+        self.best_score = 0
+        self.best_level = 1
+        self._keys = policy(0)
+
+        self.current_state = self.get_state(GameStateNum.PLAYING)
+
+    def get_state(self, state_enum):
+        if state_enum != GameStateNum.PLAYING:
+            raise ValueError(f"HeadlessGame only simulates PLAYING, not {state_enum}")
+        if state_enum not in self.states:
+            self.states[state_enum] = Playing(self)
+        return self.states[state_enum]
+
+    def read_input(self):
+        return self._keys
+
+    def restart(self):
+        """Record the finished run and start a fresh one."""
+        self.deaths += 1
+        if self.score > self.best_score:
+            self.best_score = self.score
+        self.best_level = max(self.best_level, self.level)
+        self.score = 0
+        self.level = 1
+        self.states.pop(GameStateNum.PLAYING, None)
+        self.current_state = self.get_state(GameStateNum.PLAYING)
+
+    def run(self, ticks: int = HEADLESS_TICKS) -> HeadlessResult:
+        start = time.perf_counter()
+        profiler = self.profiler
+        for tick in range(ticks):
+            profiler.begin_frame()
+            self._keys = self.policy(tick)
+            with profiler.phase("handle_events"):
+                self.current_state.handle_events(())
+            with profiler.phase("update"):
+                result = self.current_state.update(SIM_DT)
+            self.sim_clock.tick()
+            if result == GameStateNum.GAME_OVER:
+                self.restart()
+            elif self.render:
+                with profiler.phase("draw"):
+                    self.current_state.draw(self.screen)
+                    self.render_queue.flush()
+                self.compositor.discard()
+            profiler.end_frame()
+        seconds = time.perf_counter() - start
+
+        return HeadlessResult(ticks=ticks,
+                              seconds=seconds,
+                              deaths=self.deaths,
+                              best_score=max(self.best_score, self.score),
+                              best_level=max(self.best_level, self.level)
+                              )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game simulation headless at full speed.")
+    parser.add_argument("--ticks", type=int, default=HEADLESS_TICKS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="idle")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="record per-phase tick timings and write them to PATH.csv/.json")
+    parser.add_argument("--render", action="store_true", help="also draw every tick to an off-screen surface")
+    parser.add_argument("--horde", type=int, default=0, metavar="N",
+                        help="array-backed horde mode with waves of N enemies")
+    args = parser.parse_args(argv)
+
+    game = HeadlessGame(seed=args.seed,
+                        policy=POLICIES[args.policy],
+                        profile=args.profile is not None,
+                        render=args.render,
+                        horde=args.horde
+                        )
+    result = game.run(args.ticks)
+    if args.profile:
+        game.profiler.dump(args.profile)
+    print(f"{result.ticks_per_sec:.1f} ticks/sec "
+          f"({result.ticks} ticks in {result.seconds:.3f}s, "
+          f"deaths={result.deaths}, best_score={result.best_score}, best_level={result.best_level})")
+    return result
+
+
+if __name__ == "__main__":
+    main()
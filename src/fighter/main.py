@@ -2,8 +2,15 @@ import pygame
 from src.fighter.states.base import IGame
 from src.fighter.assets.assets_path_enum import InGameImageKey, SoundKey
 from src.fighter.assets.asset_manager import AssetManager
-from src.fighter.assets.audio_manager import AudioManager
-from src.fighter.core.constants import CAPTION, FRAMES, DEFAULT_RECORD_PATH
+from src.fighter.assets.audio_manager import AudioManager, DEFAULT_MIXER_CONFIG
+from src.fighter.assets.preloader import AssetPreloader
+from src.fighter.core.constants import (CAPTION, FRAMES, DEFAULT_RECORD_PATH, PROFILE, PROFILE_DUMP_PATH,
+                                     HORDE_MODE, HORDE_WAVE, LOG_LEVEL, LOG_SUBSYSTEM_LEVELS, LEVEL_FONT_SIZE)
+from src.fighter.core.clock import FixedStepClock
+from src.fighter.core.profiler import FrameProfiler
+from src.graphics.compositor import Compositor
+from src.graphics.render_queue import RenderQueue
+from src.graphics.text_cache import TextCache
 from src.fighter.core.enums import GameStateNum
 from src.fighter.metaclass import SingletonABCMeta
 from src.fighter.states.states import StartMenu, Playing, GameOver, Instructions
@@ -15,33 +22,64 @@ logger = MyLogger()
 
 class Game(IGame, metaclass=SingletonABCMeta):
     def __init__(self):
+        logger.configure(LOG_LEVEL, LOG_SUBSYSTEM_LEVELS)
+        # low-latency mixer settings have to be in place before pygame opens the audio device
+        DEFAULT_MIXER_CONFIG.pre_init()
         pygame.init()
         self.assets = AssetManager()
-        self.audio = AudioManager(self.assets)
+        self.audio = AudioManager(self.assets, config=DEFAULT_MIXER_CONFIG)
         self.records = RecordManager(DEFAULT_RECORD_PATH)
         self.states = {}
 
         self.score = 0
         self.level = 1
+        # enemies per wave in horde mode, 0 for the normal game
+        self.horde = HORDE_WAVE if HORDE_MODE else 0
 
         self.bg = InGameImageKey.BACKGROUND
 
-        # Load background first to get its size
-        self.WIDTH, self.HEIGHT = self.assets.get_width_height(self.bg)
+        # Load background first to get its size, it can only be converted once the window exists
+        background = pygame.image.load(str(self.bg.path))
+        self.WIDTH, self.HEIGHT = background.get_size()
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        self.compositor = Compositor(self.screen)
+        self.render_queue = RenderQueue(self.screen, self.compositor)
 
-        self.assets.get_image(self.bg)
+        self.assets.put_image(self.bg, background.convert_alpha())
+        self.assets.pin(self.bg)
+        # the start menu's first frame needs this one, preloading it would only race the menu
+        self.assets.get_image(InGameImageKey.BG_MENU)
+        self.assets.pin(InGameImageKey.BG_MENU)
+
+        # HUD and popup text font, shared by every game so cached text keeps hitting across restarts
+        self.hud_font = pygame.font.Font(None, LEVEL_FONT_SIZE)
+
+        # everything else streams in while the menu is up
+        self.preloader = AssetPreloader(self.assets)
 
         self.running = True
 
         pygame.display.set_caption(CAPTION)
         self.clock = pygame.time.Clock()
+        self.sim_clock = FixedStepClock()
+        self.profiler = FrameProfiler(enabled=PROFILE)
+        self.profiler.add_source("present", self.compositor.stats)
+        self.profiler.add_source("render", self.render_queue.stats)
+        self.profiler.add_counter("drawn", lambda: self.render_queue.sprites)
+        self.profiler.add_counter("culled", lambda: self.render_queue.culled)
+        self.profiler.add_source("masks", self.assets.mask_stats)
+        Playing.add_profiler_sources(self)
+        self.profiler.add_source("text_cache", TextCache().stats)
+        self.profiler.add_source("audio", self.audio.stats)
 
         self.audio.play_music(SoundKey.BG_MUSIC, loops=-1)
 
         self.current_state = self.get_state(GameStateNum.START_MENU)
 
     def get_state(self, state_enum):
+        if state_enum == GameStateNum.PLAYING and not self.preloader.done:
+            # gameplay must not start on cache misses
+            self.preloader.finish()
         if state_enum not in self.states:
             if state_enum == GameStateNum.START_MENU:
                 self.states[state_enum] = StartMenu(self)
@@ -54,32 +92,69 @@ class Game(IGame, metaclass=SingletonABCMeta):
         return self.states[state_enum]
 
     def run(self):
+        try:
+            self._loop()
+        finally:
+            self.stop()
+
+    def _loop(self):
+        profiler = self.profiler
+        frame_time = 0.0
         while self.running:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
-
-            # Handle state-specific events
+            profiler.begin_frame()
 
-            result = self.current_state.handle_events(events)
-            if result:
-                self.current_state = self.get_state(result)
+            with profiler.phase("events"):
+                events = pygame.event.get()
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.show_overlay = not profiler.show_overlay
 
-            # Update current state
-            result = self.current_state.update()
-            if result:
-                self.current_state = self.get_state(result)
-
-            self.current_state.draw(self.screen)
-
-            # Draw current state
-
-            pygame.display.flip()
-            self.clock.tick(FRAMES)
+            # Handle state-specific events
+            with profiler.phase("handle_events"):
+                result = self.current_state.handle_events(events)
+                if result:
+                    self.switch_state(result)
+
+            # Step the simulation in fixed increments, independent of render speed
+            with profiler.phase("update"):
+                if not self.preloader.done:
+                    self.preloader.poll()
+                for _ in range(self.sim_clock.advance(frame_time)):
+                    result = self.current_state.update(self.sim_clock.step)
+                    self.sim_clock.tick()
+                    if result:
+                        self.switch_state(result)
+                        break
+
+            # Draw current state, interpolated between the last two steps
+            with profiler.phase("draw"):
+                self.current_state.draw(self.screen, self.sim_clock.alpha)
+                self.render_queue.flush()
+                self.compositor.mark(profiler.draw_overlay(self.screen))
+
+            with profiler.phase("present"):
+                self.compositor.present()
+
+            profiler.end_frame()
+
+            # the frame-cap sleep is idle time, so it stays out of the frame budget
+            frame_time = self.clock.tick(FRAMES) / 1000.0
+
+    def read_input(self):
+        return pygame.key.get_pressed()
+
+    def switch_state(self, state_enum):
+        self.current_state = self.get_state(state_enum)
+        self.current_state.enter()
+        self.sim_clock.reset()
+        self.compositor.invalidate()
 
     def stop(self):
-        pass
+        if self.profiler.enabled and self.profiler.frame:
+            self.profiler.dump(PROFILE_DUMP_PATH)
+            logger.info("Frame profile written to %s.csv/.json", PROFILE_DUMP_PATH)
 
 #  test 22
 if __name__ == "__main__":
@@ -87,4 +162,4 @@ if __name__ == "__main__":
     try:
         game.run()
     except KeyboardInterrupt:
-        game.stop()
+        pass  # run() already stopped the game
@@ -10,23 +10,35 @@ class IGame(ABC):
     def run(self):
         pass
 
+    @abstractmethod
+    def read_input(self):
+        """Current key state, indexable by pygame key constants."""
+        pass
+
 
 class GameState(ABC):
     def __init__(self, game):
         self.game = game
         self.assets = game.assets
 
+    def enter(self):
+        """Called when the game switches to this state."""
+        pass
+
     @abstractmethod
     def handle_events(self, events):
         """Process pygame events."""
         pass
 
     @abstractmethod
-    def update(self):
+    def update(self, dt):
         """Advance game logic by dt seconds."""
         pass
 
     @abstractmethod
-    def draw(self, surf):
-        """Render this state to the given surface."""
+    def draw(self, surf, alpha=1.0):
+        """
+        Render this state to the given surface.
+        `alpha` is the fraction of a step elapsed since the last update, for interpolation.
+        """
         pass
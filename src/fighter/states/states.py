@@ -1,21 +1,51 @@
 from .base import GameState, IGame
 import pygame, sys
 from src.fighter.entities.player import Player
-from ..core.enums import GameStateNum, RecordField
+from ..core.enums import GameStateNum, RecordField, AssetKind
 from ..core.constants import *
 from src.fighter.entities.enemies.enemy_manager import EnemyManager
 from src.fighter.assets.assets_path_enum import InGameImageKey
 from src.graphics.scrolling_background import ScrollingBackground
-from src.graphics.score_popup import ScorePopup
+from src.graphics.popup_system import PopupSystem
+from src.fighter.core.animator import Animator
+from src.graphics.static_layer import StaticLayer
+from src.graphics.text_cache import GlyphAtlas
 
 from logger import MyLogger
 logger = MyLogger()
 
 
 class Playing(GameState):
+    # profiler sources of the game in progress, see add_profiler_sources
+    STATS = {
+        "collision": lambda playing: playing.enemy_manager.broadphase.stats(),
+        "narrowphase": lambda playing: playing.enemy_manager.narrowphase.stats(),
+        "pools": lambda playing: playing.pool_stats(),
+        "spawner": lambda playing: playing.enemy_manager.spawn_stats(),
+        "animator": lambda playing: playing.animator.stats(),
+        "hud_glyphs": lambda playing: playing.hud_glyphs.stats(),
+    }
+
+    @classmethod
+    def add_profiler_sources(cls, game: IGame):
+        """
+        Register the STATS sources with the game's profiler, once per game. Each one looks up
+        the Playing in progress when read, so the profiler never keeps a finished game alive.
+        """
+        def source(stats):
+            def read():
+                playing = game.states.get(GameStateNum.PLAYING)
+                return stats(playing) if playing is not None else {}
+            return read
+
+        for name, stats in cls.STATS.items():
+            game.profiler.add_source(name, source(stats))
+
     def __init__(self, game: IGame):
         super().__init__(game)
-        self.player = Player(self.assets, self.game)
+        # frame state of every animated entity in this game, advanced in one pass per step
+        self.animator = Animator()
+        self.player = Player(self.assets, self.game, self.animator)
         self.screen = self.game.screen
 
         self.bg_img_obj = self.game.assets.get_image(InGameImageKey.BACKGROUND)
@@ -25,67 +55,81 @@ class Playing(GameState):
                                       SCROLL_SPEED
                                       )
 
-        self.enemy_manager = EnemyManager(self.game)
+        if self.game.horde:
+            # NumPy is only needed for horde mode
+            from src.fighter.entities.enemies.enemy_horde import EnemyHorde
+            self.enemy_manager = EnemyHorde(self.game, self.game.horde)
+        else:
+            self.enemy_manager = EnemyManager(self.game, self.animator)
 
-        self.hud_font = pygame.font.Font(None, LEVEL_FONT_SIZE)   # 24-px default font
+        # owned by the game: TextCache entries are keyed by font, a new one per game would never hit
+        self.hud_font = self.game.hud_font
         self.hud_color = RED             # white text
         self.hud_margin = LEVEL_MARGIN_X
-        self.popups = []
-        self.score_font = pygame.font.Font(None, 32)
+        self.score_label = f"{RecordField.SCORE.value}: "
+        self.level_label = f"{RecordField.LEVEL.value}: "
+        self.hud_glyphs = GlyphAtlas(self.hud_font, self.hud_color, (self.score_label, self.level_label))
+        self.popups = PopupSystem(self.hud_font)
 
     def handle_events(self, events):
-        keys = pygame.key.get_pressed()
+        keys = self.game.read_input()
         self.player.handle_input(keys)
 
-    def update(self):
+    def update(self, dt):
 
         self.bg.update()
-        keys = pygame.key.get_pressed()
+        keys = self.game.read_input()
         self.player.handle_input(keys)
-        self.player.update()
+        self.player.update(dt)
 
-        self.enemy_manager.update_and_handle_kills(self.player, self.popups, self.hud_font)
+        profiler = self.game.profiler
+        with profiler.phase("spawn"):
+            self.enemy_manager.spawn_step()
 
-        self.update_popups()
+        with profiler.phase("enemies"):
+            self.enemy_manager.update(dt)
 
-        state = self.check_player_collision()
+        with profiler.phase("animation"):
+            self.animator.advance(dt)
 
-        return state
+        with profiler.phase("collision"):
+            state = self.check_player_collision()
 
-    def update_popups(self):
-        """Update all popups and remove expired ones"""
-        # Update each popup
-        for popup in self.popups:
-            popup.update()
+        with profiler.phase("popups"):
+            self.update_popups(dt)
 
-        # Remove expired popups
-        self.popups = [popup for popup in self.popups if not popup.is_expired()]
+        return state
 
-    def check_player_collision(self):
-        if self.player.attacking:
-            return None  # i
-        for e in self.enemy_manager.enemies:
-            if e.alive and self.player.player_rect.colliderect(e.enemy_rect):
-                return GameStateNum.GAME_OVER
-        return None
+    def spawn_popup(self, text, pos):
+        self.popups.spawn(text, pos)
 
-    def draw(self, surf):
-        self.bg.draw()
-        self.player.draw()
-        self.enemy_manager.draw(self.screen)
-        self.update_score(surf)
+    def update_popups(self, dt):
+        """Update all popups, expired ones free their slots"""
+        self.popups.update(dt)
 
-        for popup in self.popups:
-            popup.draw(surf)
+    def pool_stats(self) -> dict:
+        return {"popups": self.popups.stats(), **self.enemy_manager.pool_stats()}
 
-        pygame.display.flip()
+    def check_player_collision(self):
+        # kills while attacking, otherwise contact ends the game
+        if self.enemy_manager.resolve_collisions(self.player, self.spawn_popup):
+            return GameStateNum.GAME_OVER
+        return None
 
-    def update_score(self, surf):
-        score_surf = self.hud_font.render(f"{RecordField.SCORE.value}: {self.game.score}", True, self.hud_color)
-        level_surf = self.hud_font.render(f"{RecordField.LEVEL.value}: {self.game.level}", True, self.hud_color)
+    def draw(self, surf, alpha=1.0):
+        # everything goes through the render queue, drawn in layer order when the game flushes it
+        queue = self.game.render_queue
+        if self.bg.draw(queue, alpha):
+            self.game.compositor.invalidate()
+        self.player.draw(queue, alpha)
+        self.enemy_manager.draw(queue, alpha)
+        self.update_score(queue)
+        self.popups.draw(queue, alpha)
 
-        surf.blit(score_surf, (self.hud_margin, self.hud_margin))
-        surf.blit(level_surf, (self.hud_margin, self.hud_margin + score_surf.get_height() + 2))
+    def update_score(self, queue):
+        # drawn from pre-rendered glyphs, no font rendering per frame
+        score_rect = self.hud_glyphs.draw(queue, self.score_label, self.game.score, (self.hud_margin, self.hud_margin))
+        self.hud_glyphs.draw(queue, self.level_label, self.game.level, (self.hud_margin, score_rect.bottom + 2))
 
 
 class GameOver(GameState):
@@ -97,10 +141,20 @@ class GameOver(GameState):
         self.screen = self.game.screen
 
         self._records_loaded = False
+        self._released = False
         self._top_records    = []
+        self.layer = StaticLayer(self._build_layer)
+
+    def enter(self):
+        self.layer.invalidate()
+        # the finished game is not coming back (restart builds a new one), let its sprites go
+        self.game.states.pop(GameStateNum.PLAYING, None)
+        self._released = self.assets.release(AssetKind.ANIMATION) > 0
+        # every game over records its own result
+        self._records_loaded = False
 
-    def update(self):
-        # once, when we first hit GameOver, save & load top records
+    def update(self, dt):
+        # once per game over, save & load top records
         if not self._records_loaded:
             self.game.records.add(self.game.score, self.game.level)
             self.game.records.save()
@@ -116,12 +170,20 @@ class GameOver(GameState):
                     self.game.level = 1
                     # reinitialize the game
                     self.game.states.pop(GameStateNum.PLAYING, None)
+                    # the sprites released on entering GameOver stream back in while the menu is up
+                    if self._released:
+                        self.game.preloader.requeue(AssetKind.ANIMATION)
                     return GameStateNum.START_MENU
                 elif ev.key == pygame.K_q:
                     pygame.quit()
                     sys.exit()
 
-    def draw(self, surf):
+    def draw(self, surf, alpha=1.0):
+        records = tuple((e['score'], e['level'], e['timestamp']) for e in self._top_records)
+        self.layer.draw(surf, (self.game.WIDTH, self.game.HEIGHT, self.game.score, records), self.game.compositor)
+
+    def _build_layer(self):
+        surf = pygame.Surface((self.game.WIDTH, self.game.HEIGHT))
         # clear
         surf.fill((0, 0, 0))
 
@@ -154,8 +216,7 @@ class GameOver(GameState):
             line_surf = self.small.render(line, True, WHITE)
             line_rect = line_surf.get_rect(center=(mid_x + 100, mid_y + 50 * (i+2)))
             surf.blit(line_surf, line_rect)
-
-        pygame.display.flip()
+        return surf
 
 
 class Instructions(GameState):
@@ -166,11 +227,17 @@ class Instructions(GameState):
         # prepare text
         self.font = pygame.font.Font(None, INST_FONT_SIZE)
         self.lines = INSTRUCTION_LINES
+        self.layer = StaticLayer(self._build_layer)
 
-    def draw(self, surf):
-        inst_screen = self.game.screen
+    def enter(self):
+        self.layer.invalidate()
 
+    def draw(self, surf, alpha=1.0):
+        self.layer.draw(surf, (self.game.WIDTH, self.game.HEIGHT), self.game.compositor)
+
+    def _build_layer(self):
         width, height = self.game.WIDTH, self.game.HEIGHT
+        inst_screen = pygame.Surface((width, height))
 
         scaled_image = pygame.transform.scale(
             self.instruction_image,
@@ -197,8 +264,7 @@ class Instructions(GameState):
             rect = surf.get_rect(x=INST_MARGIN_X, y=y)
             inst_screen.blit(surf, rect)
             y += INST_LINE_SPACING
-
-        pygame.display.update()
+        return inst_screen
 
     def handle_events(self, events):
         #any Click to exit the function
@@ -206,7 +272,7 @@ class Instructions(GameState):
             if event.type == pygame.MOUSEBUTTONDOWN:
                 return GameStateNum.START_MENU
 
-    def update(self):
+    def update(self, dt):
         return None
 
 
@@ -216,6 +282,10 @@ class StartMenu(GameState):
         self.font = pygame.font.Font(None, MM_FONT_SIZE)
         self.title_text = self.font.render(MM_TITLE, True, RED)
         self.option_rects = []
+        self.layer = StaticLayer(self._build_layer)
+
+    def enter(self):
+        self.layer.invalidate()
 
     def handle_events(self, events):
         for event in events:
@@ -233,7 +303,14 @@ class StartMenu(GameState):
                             pygame.quit()
         return None
 
-    def draw(self, surf):
+    def draw(self, surf, alpha=1.0):
+        # redrawn once more when loading ends, to clear the progress bar
+        inputs = (self.game.WIDTH, self.game.HEIGHT, self.game.preloader.done)
+        self.layer.draw(surf, inputs, self.game.compositor)
+        self.draw_loading(surf)
+
+    def _build_layer(self):
+        surf = pygame.Surface((self.game.WIDTH, self.game.HEIGHT))
         bg_menu = self.assets.get_image(InGameImageKey.BG_MENU)
         surf.blit(bg_menu, CENTER)
         screen_width = self.game.WIDTH
@@ -249,6 +326,22 @@ class StartMenu(GameState):
             rect = option_text.get_rect(center=(screen_width // 2, MM_OPTIONS_Y_OFFSET + i * MM_OPTIONS_DISTANCE))
             self.option_rects.append(rect)
             surf.blit(option_text, rect)
-
-    def update(self):
+        return surf
+
+    def draw_loading(self, surf):
+        """Progress bar under the options while assets are still preloading."""
+        preloader = self.game.preloader
+        if preloader.done:
+            return
+        bar = pygame.Rect(0, 0, MM_PROGRESS_W, MM_PROGRESS_H)
+        bar.center = (self.game.WIDTH // 2,
+                      MM_OPTIONS_Y_OFFSET + (len(MM_OPTIONS) - 1) * MM_OPTIONS_DISTANCE + MM_PROGRESS_Y_OFFSET)
+        pygame.draw.rect(surf, WHITE, bar, 1)
+        fill = bar.inflate(-2, -2)
+        fill.width = int(fill.width * preloader.progress)
+        pygame.draw.rect(surf, WHITE, fill)
+        # the bar fills in over time, so it has to be presented every frame
+        self.game.compositor.mark(bar)
+
+    def update(self, dt):
         return None
@@ -0,0 +1,76 @@
+import pygame
+from src.fighter.core.constants import PRESENT_MAX_AREA, PRESENT_MAX_RECTS
+
+
+class Compositor:
+    """
+    The only place that presents the back buffer to the display.
+    States draw as usual and mark the rects that changed; `present` then pushes
+    just those areas (plus where they were last frame), or flips the whole
+    screen when that is cheaper or something invalidated everything.
+    """
+
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+        self.screen_area = screen.get_width() * screen.get_height()
+        self._dirty: list[pygame.Rect] = []
+        self._previous: list[pygame.Rect] = []
+        self._full = True
+
+        self.full_presents = 0
+        self.partial_presents = 0
+        self.skipped_presents = 0
+        self.last_rect_count = 0
+
+    def invalidate(self):
+        """Everything changed this frame, e.g. a scrolling background or a state switch."""
+        self._full = True
+
+    @property
+    def invalidated(self) -> bool:
+        """Whether this frame will be presented in full anyway."""
+        return self._full
+
+    def mark(self, rect):
+        """Record an area drawn this frame. Accepts what Surface.blit returns."""
+        if rect:
+            self._dirty.append(pygame.Rect(rect))
+
+    def present(self):
+        dirty = self._dirty
+        if self._full:
+            pygame.display.flip()
+            self.full_presents += 1
+            self.last_rect_count = 0
+        elif dirty or self._previous:
+            # areas drawn last frame must be refreshed too, the sprite may have left them
+            rects = dirty + self._previous
+            area = sum(r.width * r.height for r in rects)
+            if len(rects) > PRESENT_MAX_RECTS or area > self.screen_area * PRESENT_MAX_AREA:
+                pygame.display.flip()
+                self.full_presents += 1
+                self.last_rect_count = 0
+            else:
+                pygame.display.update(rects)
+                self.partial_presents += 1
+                self.last_rect_count = len(rects)
+        else:
+            self.skipped_presents += 1
+            self.last_rect_count = 0
+
+        self._previous = dirty
+        self._dirty = []
+        self._full = False
+
+    def discard(self):
+        """Forget this frame's marks without presenting (headless runs)."""
+        self._dirty.clear()
+        self._full = False
+
+    def stats(self) -> dict:
+        return {
+            "full": self.full_presents,
+            "partial": self.partial_presents,
+            "skipped": self.skipped_presents,
+            "last_rects": self.last_rect_count,
+        }
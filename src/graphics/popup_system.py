@@ -0,0 +1,133 @@
+from array import array
+from collections import OrderedDict
+
+import pygame
+from src.fighter.core.enums import RenderLayer
+from src.fighter.core.constants import (POPUP_CAPACITY, POPUP_LIFETIME, POPUP_RISE_SPEED, POPUP_FADE_START,
+                                        POPUP_FADE_STEPS, POPUP_COLOR, POPUP_TEXTS)
+from src.graphics.text_cache import TextCache
+
+
+class PopupSystem:
+    """
+    Fixed-capacity score popups. Positions and ages live in parallel arrays; live popups
+    occupy slots [0, count) and an expired one is replaced by the last live slot, so nothing
+    is rebuilt per frame. Each text is rendered through the TextCache, with POPUP_FADE_STEPS
+    pre-faded copies kept for the POPUP_TEXTS most recent texts, and all live popups go to
+    the render queue as one batch.
+    """
+
+    def __init__(self,
+                 font: pygame.font.Font,
+                 color=POPUP_COLOR,
+                 capacity: int = POPUP_CAPACITY,
+                 lifetime: float = POPUP_LIFETIME
+                 ):
+        self.font = font
+        self.color = color
+        self.capacity = capacity
+        self.lifetime = lifetime
+        self.fade_start = lifetime * POPUP_FADE_START
+
+        self.count = 0
+        self.x = array("d", [0.0]) * capacity
+        self.y = array("d", [0.0]) * capacity
+        self.prev_y = array("d", [0.0]) * capacity      # y at the previous step, for interpolation
+        self.age = array("d", [0.0]) * capacity         # simulated seconds since spawn
+        self._fades = [None] * capacity                 # the slot's tuple of faded surfaces
+        self._variants = OrderedDict()                  # text -> faded surfaces, opaque first, LRU
+
+        self.spawned = 0
+        self.overwritten = 0
+        self.high_water = 0
+
+    def _faded(self, text):
+        variants = self._variants.get(text)
+        if variants is not None:
+            self._variants.move_to_end(text)
+            return variants
+        # the cached surface is shared, only copies get an alpha
+        base = TextCache().render(self.font, text, self.color)
+        variants = []
+        for step in range(POPUP_FADE_STEPS):
+            faded = base.copy()
+            faded.set_alpha(round(255 * (1 - step / POPUP_FADE_STEPS)))
+            variants.append(faded)
+        variants = self._variants[text] = tuple(variants)
+        # live popups keep their own reference to an evicted text's copies
+        if len(self._variants) > POPUP_TEXTS:
+            self._variants.popitem(last=False)
+        return variants
+
+    def spawn(self, text: str, pos):
+        if self.count < self.capacity:
+            slot = self.count
+            self.count += 1
+            self.high_water = max(self.high_water, self.count)
+        else:
+            # full: reuse the popup closest to expiring
+            slot = max(range(self.count), key=self.age.__getitem__)
+            self.overwritten += 1
+        self.x[slot], y = pos
+        self.y[slot] = self.prev_y[slot] = y
+        self.age[slot] = 0.0
+        self._fades[slot] = self._faded(text)
+        self.spawned += 1
+
+    def _remove(self, slot):
+        last = self.count - 1
+        if slot != last:
+            self.x[slot] = self.x[last]
+            self.y[slot] = self.y[last]
+            self.prev_y[slot] = self.prev_y[last]
+            self.age[slot] = self.age[last]
+            self._fades[slot] = self._fades[last]
+        self._fades[last] = None
+        self.count = last
+
+    def update(self, dt):
+        """Advance by dt simulated seconds, expired popups free their slots."""
+        rise = POPUP_RISE_SPEED * dt
+        slot = 0
+        while slot < self.count:
+            self.age[slot] += dt
+            if self.age[slot] > self.lifetime:
+                # the last live popup moves into this slot, look at it next
+                self._remove(slot)
+                continue
+            self.prev_y[slot] = self.y[slot]
+            self.y[slot] -= rise
+            slot += 1
+
+    def _fade_step(self, age):
+        if age <= self.fade_start:
+            return 0
+        step = int((age - self.fade_start) / (self.lifetime - self.fade_start) * POPUP_FADE_STEPS)
+        return min(step, POPUP_FADE_STEPS - 1)
+
+    def draw(self, queue, alpha=1.0):
+        """Submit every live popup to the render queue as one batch."""
+        if not self.count:
+            return
+        x, y, prev_y, age, fades = self.x, self.y, self.prev_y, self.age, self._fades
+        queue.extend(RenderLayer.POPUPS,
+                     [(fades[i][self._fade_step(age[i])], (x[i], prev_y[i] + (y[i] - prev_y[i]) * alpha))
+                      for i in range(self.count)])
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        for slot in range(self.count):
+            self._fades[slot] = None
+        self.count = 0
+
+    def stats(self) -> dict:
+        return {
+            "live": self.count,
+            "capacity": self.capacity,
+            "high_water": self.high_water,
+            "spawned": self.spawned,
+            "overwritten": self.overwritten,
+            "texts": len(self._variants),
+        }
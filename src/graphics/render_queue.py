@@ -0,0 +1,91 @@
+import pygame
+
+
+class RenderQueue:
+    """
+    Collects this frame's sprites as (surface, position) per layer and draws them all,
+    lowest layer first and in submission order within a layer, with one Surface.blits call.
+    Sprites entirely outside the target are culled on submit.
+    Covered areas are reported to the compositor unless it already presents the whole screen.
+    """
+
+    def __init__(self, target: pygame.Surface, compositor=None):
+        self.target = target
+        self.compositor = compositor
+        self._layers = {}           # layer -> [(surface, pos), ...]
+        self._outlines = []         # debug rects, drawn over the sprites
+        self.viewport = target.get_rect()
+        self._culled = 0
+
+        self.frames = 0
+        self.draw_calls = 0         # last frame
+        self.sprites = 0
+        self.culled = 0
+        self.pixels = 0
+
+    def submit(self, surface: pygame.Surface, pos, layer: int):
+        x, y = pos
+        view = self.viewport
+        if x >= view.right or y >= view.bottom or x + surface.get_width() <= view.left \
+                or y + surface.get_height() <= view.top:
+            self._culled += 1
+            return
+        bucket = self._layers.get(layer)
+        if bucket is None:
+            bucket = self._layers[layer] = []
+        bucket.append((surface, pos))
+
+    def extend(self, layer: int, items):
+        """Submit many (surface, pos) pairs on one layer, already culled by the caller."""
+        bucket = self._layers.get(layer)
+        if bucket is None:
+            bucket = self._layers[layer] = []
+        bucket.extend(items)
+
+    def note_culled(self, count: int):
+        """Count sprites a caller skipped itself (batched or dormant entities)."""
+        self._culled += count
+
+    def outline(self, rect, color, width: int = 1):
+        self._outlines.append((pygame.Rect(rect), color, width))
+
+    def flush(self):
+        sequence = []
+        for layer in sorted(self._layers):
+            sequence.extend(self._layers[layer])
+        self._layers.clear()
+
+        draw_calls = 0
+        pixels = 0
+        if sequence:
+            self.target.blits(sequence, doreturn=False)
+            draw_calls += 1
+            clip = self.target.get_clip()
+            mark = self.compositor is not None and not self.compositor.invalidated
+            for surface, (x, y) in sequence:
+                rect = clip.clip(int(x), int(y), *surface.get_size())
+                pixels += rect.width * rect.height
+                if mark:
+                    self.compositor.mark(rect)
+
+        for rect, color, width in self._outlines:
+            if self.compositor is not None:
+                self.compositor.mark(pygame.draw.rect(self.target, color, rect, width))
+            draw_calls += 1
+        self._outlines.clear()
+
+        self.frames += 1
+        self.draw_calls = draw_calls
+        self.sprites = len(sequence)
+        self.culled = self._culled
+        self._culled = 0
+        self.pixels = pixels
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "draw_calls": self.draw_calls,
+            "sprites": self.sprites,
+            "culled": self.culled,
+            "pixels": self.pixels,
+        }
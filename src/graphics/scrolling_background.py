@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from src.fighter.core.enums import RenderLayer
+
 
 @dataclass(slots=True)
 class ScrollingBackground:
@@ -28,7 +30,12 @@ class ScrollingBackground:
         if self.x2 <= -self.bg_width:
             self.x2 = self.bg_width
 
-    def draw(self):
-        self.screen.blit(self.image, (self.x1, 0))
-        self.screen.blit(self.image, (self.x2, 0))
+    def draw(self, queue, alpha=1.0):
+        """Returns True when the background moved, i.e. the whole screen changed."""
+        # the previous step was scroll_speed further right; offsetting from the
+        # current position keeps the wrap seamless
+        lag = self.scroll_speed * (1 - alpha)
+        queue.submit(self.image, (self.x1 + lag, 0), RenderLayer.BACKGROUND)
+        queue.submit(self.image, (self.x2 + lag, 0), RenderLayer.BACKGROUND)
+        return self.scroll_speed != 0
 
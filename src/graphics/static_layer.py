@@ -0,0 +1,35 @@
+from typing import Callable, Hashable
+
+import pygame
+
+
+class StaticLayer:
+    """
+    A screen's unchanging content, rendered once into an off-screen surface.
+    It is rebuilt only when its inputs change, and blitted only when the
+    screen no longer shows it (first frame, after a state switch).
+    """
+
+    def __init__(self, build: Callable[[], pygame.Surface]):
+        self._build = build
+        self._surface = None
+        self._inputs = None
+        self.on_screen = False
+        self.builds = 0
+
+    def invalidate(self):
+        """The screen was drawn over, blit again on the next draw."""
+        self.on_screen = False
+
+    def draw(self, surf: pygame.Surface, inputs: Hashable, compositor) -> bool:
+        """Bring the layer on screen if needed. Returns True when something was drawn."""
+        if self._surface is None or inputs != self._inputs:
+            self._surface = self._build()
+            self._inputs = inputs
+            self.builds += 1
+            self.on_screen = False
+        if self.on_screen:
+            return False
+        compositor.mark(surf.blit(self._surface, (0, 0)))
+        self.on_screen = True
+        return True
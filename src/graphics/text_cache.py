@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+import pygame
+from src.fighter.metaclass import SingletonMeta
+from src.fighter.core.constants import TEXT_CACHE_SIZE, GLYPH_CHARS
+from src.fighter.core.enums import RenderLayer
+
+
+class TextCache(metaclass=SingletonMeta):
+    """
+    LRU cache of rendered text keyed by (font, text, color, antialias).
+    Surfaces are shared between callers: set alpha right before blitting, never keep it.
+    """
+
+    def __init__(self, capacity: int = TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self._surfaces: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "entries": len(self._surfaces)}
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered digits and fixed labels for one font and color.
+    Numbers are drawn glyph by glyph, so changing values never call font.render.
+    """
+
+    def __init__(self, font: pygame.font.Font, color, labels=(), antialias: bool = True):
+        self.glyphs = {ch: font.render(ch, antialias, color) for ch in GLYPH_CHARS}
+        self.labels = {label: font.render(label, antialias, color) for label in labels}
+        self.height = font.get_height()
+        self.glyph_blits = 0
+
+    def draw(self, queue, label: str, value: int, pos, layer: int = RenderLayer.HUD) -> pygame.Rect:
+        """Submit `label` followed by `value` at pos to the render queue, returns the covered rect."""
+        x, y = pos
+        label_surf = self.labels[label]
+        queue.submit(label_surf, (x, y), layer)
+        x += label_surf.get_width()
+        for ch in str(value):
+            glyph = self.glyphs[ch]
+            queue.submit(glyph, (x, y), layer)
+            x += glyph.get_width()
+        self.glyph_blits += len(str(value))
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+    def stats(self) -> dict:
+        return {"glyphs": len(self.glyphs), "labels": len(self.labels), "glyph_blits": self.glyph_blits}